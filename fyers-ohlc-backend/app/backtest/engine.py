@@ -1,8 +1,34 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from ..strategies.base import TradeSignal
 
+def signals_to_arrays(signals: List[TradeSignal]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Unpack a list of TradeSignal objects into columnar NumPy arrays.
+
+    Returns:
+        Tuple of (kind, price, stop_loss, target) arrays where
+        kind is 0 for BUY, 1 for SELL and 2 for anything else.
+    """
+    n = len(signals)
+    kind = np.full(n, 2, dtype=np.int8)
+    price = np.empty(n, dtype=np.float64)
+    stop_loss = np.empty(n, dtype=np.float64)
+    target = np.empty(n, dtype=np.float64)
+
+    for i, signal in enumerate(signals):
+        if signal.signal == 'BUY':
+            kind[i] = 0
+        elif signal.signal == 'SELL':
+            kind[i] = 1
+        price[i] = signal.entry_price
+        stop_loss[i] = signal.stop_loss
+        target[i] = signal.target_price
+
+    return kind, price, stop_loss, target
+
 class BacktestResult:
     def __init__(self):
         self.total_trades = 0
@@ -14,19 +40,19 @@ class BacktestResult:
         self.avg_profit = 0.0
         self.avg_loss = 0.0
         self.trade_history = []
-        
+
     def add_trade(self, trade: Dict[str, Any]):
         self.trade_history.append(trade)
         self.total_trades += 1
-        
+
         if trade['pnl'] > 0:
             self.winning_trades += 1
         else:
             self.losing_trades += 1
-            
+
         self.net_pnl += trade['pnl']
         self.win_rate = (self.winning_trades / self.total_trades) * 100 if self.total_trades > 0 else 0
-        
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'total_trades': self.total_trades,
@@ -46,91 +72,195 @@ class BacktestEngine:
         self.current_capital = initial_capital
         self.position = None
         self.trade_history = []
-        
+
     def run(
         self,
         data: pd.DataFrame,
         signals: List[TradeSignal],
         commission: float = 0.0005,  # 0.05% commission per trade
         slippage: float = 0.0005     # 0.05% slippage per trade
+    ) -> Dict[str, Any]:
+        # Work on columnar arrays instead of touching TradeSignal attributes
+        # (and a per-position dict) inside the loop.
+        kind, price, stop_loss, target = signals_to_arrays(signals)
+        timestamps = [s.timestamp for s in signals]
+        return self._run_arrays(
+            kind, price, stop_loss, target, timestamps,
+            exit_payload=lambda i: signals[i].to_dict(),
+            entry_ref=lambda i: signals[i],
+            commission=commission,
+            slippage=slippage,
+        )
+
+    def run_from_df(
+        self,
+        data: pd.DataFrame,
+        signals_df: pd.DataFrame,
+        commission: float = 0.0005,
+        slippage: float = 0.0005
+    ) -> Dict[str, Any]:
+        """
+        Backtest directly from a signals DataFrame, bypassing TradeSignal
+        object construction entirely. Expects columns
+        ['signal', 'entry_price', 'stop_loss', 'target_price', 'timestamp'].
+        """
+        sig = signals_df['signal'].to_numpy()
+        kind = np.full(len(sig), 2, dtype=np.int8)
+        kind[sig == 'BUY'] = 0
+        kind[sig == 'SELL'] = 1
+        price = signals_df['entry_price'].to_numpy(dtype=np.float64)
+        stop_loss = signals_df['stop_loss'].to_numpy(dtype=np.float64)
+        target = signals_df['target_price'].to_numpy(dtype=np.float64)
+        timestamps = signals_df['timestamp'].tolist()
+        # Plain tuple rows: building a dict from these is much cheaper than
+        # materializing a Series per row via .iloc[i].to_dict()
+        columns = signals_df.columns.tolist()
+        rows = signals_df.to_numpy()
+        return self._run_arrays(
+            kind, price, stop_loss, target, timestamps,
+            exit_payload=lambda i: dict(zip(columns, rows[i])),
+            entry_ref=lambda i: None,
+            commission=commission,
+            slippage=slippage,
+        )
+
+    def _run_arrays(
+        self,
+        kind: np.ndarray,
+        price: np.ndarray,
+        stop_loss: np.ndarray,
+        target: np.ndarray,
+        timestamps: List[Any],
+        exit_payload,
+        entry_ref,
+        commission: float,
+        slippage: float
     ) -> Dict[str, Any]:
         result = BacktestResult()
-        
-        for signal in signals:
-            if signal.signal == 'BUY' and not self.position:
-                # Calculate position size (1% risk per trade)
-                risk_amount = self.current_capital * 0.01
-                risk_per_share = abs(signal.entry_price - signal.stop_loss)
-                position_size = int(risk_amount / risk_per_share) if risk_per_share > 0 else 0
-                
+        n = len(kind)
+
+        capital = self.current_capital
+        in_position = self.position is not None
+        if in_position:
+            entry_price = self.position['entry_price']
+            entry_stop = self.position['stop_loss']
+            entry_target = self.position['target']
+            size = self.position['size']
+            entry_time = self.position['entry_time']
+        else:
+            entry_price = entry_stop = entry_target = 0.0
+            size = 0
+            entry_time = None
+        entry_idx = -1
+
+        # Per-closed-trade records, preallocated (at most one trade per
+        # BUY/SELL pair) and written by index instead of list appends
+        capacity = n // 2 + 1
+        entry_prices = np.empty(capacity, dtype=np.float64)
+        exit_prices = np.empty(capacity, dtype=np.float64)
+        sizes = np.empty(capacity, dtype=np.int64)
+        pnls = np.empty(capacity, dtype=np.float64)
+        entry_times = np.empty(capacity, dtype=object)
+        exit_idxs = np.empty(capacity, dtype=np.intp)
+        idx = 0
+
+        # Specialize the loop for this run's fixed costs: fold commission
+        # and slippage into three constant multipliers up front
+        entry_cost_mult = 1.0 + commission + slippage
+        exit_slip_mult = 1.0 - slippage
+        exit_net_mult = 1.0 - commission
+
+        for i in range(n):
+            k = kind[i]
+            if k == 0 and not in_position:
+                # Position size for 1% risk per trade
+                risk_per_share = abs(price[i] - stop_loss[i])
+                position_size = int(capital * 0.01 / risk_per_share) if risk_per_share > 0 else 0
+
                 if position_size > 0:
-                    # Calculate costs
-                    cost = signal.entry_price * position_size
-                    commission_cost = cost * commission
-                    slippage_cost = cost * slippage
-                    total_cost = cost + commission_cost + slippage_cost
-                    
-                    # Update position
-                    self.position = {
-                        'entry_price': signal.entry_price,
-                        'stop_loss': signal.stop_loss,
-                        'target': signal.target_price,
-                        'size': position_size,
-                        'entry_time': signal.timestamp,
-                        'entry_signal': signal
-                    }
-                    
-                    # Update capital
-                    self.current_capital -= total_cost
-                    
-            elif signal.signal == 'SELL' and self.position:
-                # Calculate exit price with slippage
-                exit_price = signal.entry_price * (1 - slippage)
-                
-                # Calculate P&L
-                entry_price = self.position['entry_price']
-                pnl = (exit_price - entry_price) * self.position['size']
-                pnl -= (entry_price * self.position['size'] * commission)  # Commission on exit
-                
-                # Update trade history
-                trade = {
-                    'entry_price': entry_price,
-                    'exit_price': exit_price,
-                    'size': self.position['size'],
-                    'entry_time': self.position['entry_time'],
-                    'exit_time': signal.timestamp,
-                    'pnl': pnl,
-                    'return_pct': (exit_price - entry_price) / entry_price * 100,
-                    'signal': signal.to_dict()
-                }
-                
-                result.add_trade(trade)
-                
-                # Update capital
-                self.current_capital += (exit_price * self.position['size']) - (exit_price * self.position['size'] * commission)
-                self.position = None
-                
+                    entry_price = price[i]
+                    entry_stop = stop_loss[i]
+                    entry_target = target[i]
+                    size = position_size
+                    entry_time = timestamps[i]
+                    entry_idx = i
+
+                    # Entry cost with commission and slippage
+                    capital -= entry_price * position_size * entry_cost_mult
+                    in_position = True
+
+            elif k == 1 and in_position:
+                exit_price = price[i] * exit_slip_mult
+                pnl = (exit_price - entry_price) * size
+                pnl -= entry_price * size * commission  # Commission on exit
+
+                entry_prices[idx] = entry_price
+                exit_prices[idx] = exit_price
+                sizes[idx] = size
+                pnls[idx] = pnl
+                entry_times[idx] = entry_time
+                exit_idxs[idx] = i
+                idx += 1
+
+                capital += exit_price * size * exit_net_mult
+                in_position = False
+
+        self.current_capital = capital
+        if in_position:
+            self.position = {
+                'entry_price': entry_price,
+                'stop_loss': entry_stop,
+                'target': entry_target,
+                'size': size,
+                'entry_time': entry_time,
+                'entry_signal': entry_ref(entry_idx) if entry_idx >= 0 else None
+            }
+        else:
+            self.position = None
+
+        # Trim to the trades actually taken
+        entry_prices = entry_prices[:idx]
+        exit_prices = exit_prices[:idx]
+        sizes = sizes[:idx]
+        pnls = pnls[:idx]
+        entry_times = entry_times[:idx]
+        exit_idxs = exit_idxs[:idx]
+
+        # Materialize the trade history through one DataFrame build and a
+        # single to_dict('records') export instead of per-trade dict literals
+        if idx:
+            hist_df = pd.DataFrame({
+                'entry_price': entry_prices,
+                'exit_price': exit_prices,
+                'size': sizes,
+                'entry_time': entry_times,
+                'exit_time': [timestamps[j] for j in exit_idxs],
+                'pnl': pnls,
+                'return_pct': (exit_prices - entry_prices) / entry_prices * 100,
+            })
+            records = hist_df.to_dict('records')
+            for record, j in zip(records, exit_idxs):
+                record['signal'] = exit_payload(j)
+            result.trade_history = records
+
+        result.total_trades = idx
+        result.winning_trades = int((pnls > 0).sum())
+        result.losing_trades = idx - result.winning_trades
+        result.net_pnl = float(pnls.sum())
+        result.win_rate = (result.winning_trades / idx) * 100 if idx > 0 else 0
+
         # Calculate metrics
         if result.total_trades > 0:
-            winning_pnls = [t['pnl'] for t in result.trade_history if t['pnl'] > 0]
-            losing_pnls = [t['pnl'] for t in result.trade_history if t['pnl'] <= 0]
-            
-            result.avg_profit = sum(winning_pnls) / len(winning_pnls) if winning_pnls else 0
-            result.avg_loss = abs(sum(losing_pnls) / len(losing_pnls)) if losing_pnls else 0
-            
-            # Calculate max drawdown
-            equity_curve = [self.initial_capital]
-            for trade in result.trade_history:
-                equity_curve.append(equity_curve[-1] + trade['pnl'])
-                
-            peak = equity_curve[0]
-            max_dd = 0
-            for value in equity_curve:
-                if value > peak:
-                    peak = value
-                dd = (peak - value) / peak
-                if dd > max_dd:
-                    max_dd = dd
-            result.max_drawdown = max_dd * 100  # as percentage
-            
+            pnl_arr = pnls
+            winning_pnls = pnl_arr[pnl_arr > 0]
+            losing_pnls = pnl_arr[pnl_arr <= 0]
+
+            result.avg_profit = float(winning_pnls.mean()) if winning_pnls.size else 0
+            result.avg_loss = float(abs(losing_pnls.mean())) if losing_pnls.size else 0
+
+            # Max drawdown from the equity curve in one vectorized pass
+            equity = np.r_[self.initial_capital, self.initial_capital + np.cumsum(pnl_arr)]
+            peaks = np.maximum.accumulate(equity)
+            result.max_drawdown = float(((peaks - equity) / peaks).max() * 100)
+
         return result.to_dict()
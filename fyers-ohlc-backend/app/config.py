@@ -1,26 +1,49 @@
+from dataclasses import dataclass
 from dotenv import load_dotenv
+from typing import Optional
 import os
 
 load_dotenv()
 
+
+@dataclass(frozen=True, slots=True)
 class Settings:
-    FYERS_CLIENT_ID = os.getenv("FYERS_CLIENT_ID")
-    FYERS_SECRET_KEY = os.getenv("FYERS_SECRET_KEY")
-    FYERS_REDIRECT_URI = os.getenv("FYERS_REDIRECT_URI")
+    """Environment-derived settings, read once at import. Frozen + slotted so
+    hot-loop attribute access is slot-indexed instead of a __dict__ lookup."""
+
+    FYERS_CLIENT_ID: Optional[str]
+    FYERS_SECRET_KEY: Optional[str]
+    FYERS_REDIRECT_URI: Optional[str]
 
-    MONGO_URI = os.getenv("MONGO_URI")
-    DB_NAME = os.getenv("DB_NAME")
+    MONGO_URI: Optional[str]
+    DB_NAME: Optional[str]
     # Seconds before expiry to attempt refresh (default 60s)
-    REFRESH_BUFFER_SECONDS = int(os.getenv("REFRESH_BUFFER_SECONDS", "60"))
+    REFRESH_BUFFER_SECONDS: int
     # How often to check when no expiry info is available (default 300s)
-    REFRESH_CHECK_INTERVAL = int(os.getenv("REFRESH_CHECK_INTERVAL", "300"))
+    REFRESH_CHECK_INTERVAL: int
     # Optionally disable background token refresher for debugging
-    DISABLE_TOKEN_REFRESHER = os.getenv("DISABLE_TOKEN_REFRESHER", "false").lower() in ("1", "true", "yes")
-    
+    DISABLE_TOKEN_REFRESHER: bool
+
     # Disable storing live market data in MongoDB (default: True - don't store live data)
-    DISABLE_LIVE_DATA_STORAGE = os.getenv("DISABLE_LIVE_DATA_STORAGE", "true").lower() in ("1", "true", "yes")
-    
+    DISABLE_LIVE_DATA_STORAGE: bool
+
     # Number of days to consider as "live" data (data within this many days won't be stored)
-    LIVE_DATA_THRESHOLD_DAYS = int(os.getenv("LIVE_DATA_THRESHOLD_DAYS", "1"))
+    LIVE_DATA_THRESHOLD_DAYS: int
+
+    @classmethod
+    def load(cls) -> "Settings":
+        return cls(
+            FYERS_CLIENT_ID=os.getenv("FYERS_CLIENT_ID"),
+            FYERS_SECRET_KEY=os.getenv("FYERS_SECRET_KEY"),
+            FYERS_REDIRECT_URI=os.getenv("FYERS_REDIRECT_URI"),
+            MONGO_URI=os.getenv("MONGO_URI"),
+            DB_NAME=os.getenv("DB_NAME"),
+            REFRESH_BUFFER_SECONDS=int(os.getenv("REFRESH_BUFFER_SECONDS", "60")),
+            REFRESH_CHECK_INTERVAL=int(os.getenv("REFRESH_CHECK_INTERVAL", "300")),
+            DISABLE_TOKEN_REFRESHER=os.getenv("DISABLE_TOKEN_REFRESHER", "false").lower() in ("1", "true", "yes"),
+            DISABLE_LIVE_DATA_STORAGE=os.getenv("DISABLE_LIVE_DATA_STORAGE", "true").lower() in ("1", "true", "yes"),
+            LIVE_DATA_THRESHOLD_DAYS=int(os.getenv("LIVE_DATA_THRESHOLD_DAYS", "1")),
+        )
+
 
-settings = Settings()
+settings = Settings.load()
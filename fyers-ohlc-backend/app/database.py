@@ -1,35 +1,66 @@
+import threading
+
 from pymongo import MongoClient
 from app.config import settings
 
-# Default to None so other modules can import this file even if Mongo is down
-client = None
-db = None
-ohlc_collection = None
-tokens_collection = None
+# Connection state (client / db / ohlc_collection / tokens_collection) is
+# created lazily on first attribute access via __getattr__ below, so
+# importing this module never blocks on Mongo (the old module-level ping
+# cost up to 5s for every importer when Mongo was slow or down). The names
+# stay None when the connection fails, as before.
+_connect_lock = threading.Lock()
+_initialized = False
+
+
+def _connect():
+    """Connect once, thread-safe. Leaves the module names as None on failure."""
+    global client, db, ohlc_collection, tokens_collection, _initialized
 
-try:
-    client = MongoClient(settings.MONGO_URI, serverSelectionTimeoutMS=5000)
-    # Force connection
-    client.admin.command("ping")
+    with _connect_lock:
+        if _initialized:
+            return
+        try:
+            client = MongoClient(
+                settings.MONGO_URI,
+                serverSelectionTimeoutMS=5000,
+                connectTimeoutMS=2000,
+                maxPoolSize=50,
+                minPoolSize=5,
+            )
+            # Force connection
+            client.admin.command("ping")
 
-    db = client[settings.DB_NAME]
-    ohlc_collection = db["ohlc"]
-    tokens_collection = db["tokens"]
+            db = client[settings.DB_NAME]
+            ohlc_collection = db["ohlc"]
+            tokens_collection = db["tokens"]
 
-    print("✅ MongoDB connected successfully")
+            print("✅ MongoDB connected successfully")
 
-except Exception as e:
-    # Keep module-level names defined (None) instead of blowing up on import
-    print("❌ MongoDB connection failed")
-    print(e)
+        except Exception as e:
+            # Keep module-level names defined (None) instead of blowing up
+            client = db = ohlc_collection = tokens_collection = None
+            print("❌ MongoDB connection failed")
+            print(e)
+        finally:
+            _initialized = True
+
+
+def __getattr__(name):
+    # Lazy init: the first access to any connection attribute connects
+    if name in ("client", "db", "ohlc_collection", "tokens_collection") and not _initialized:
+        _connect()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_db():
     """
     Get database instance.
-    
+
     Returns the database object for accessing collections.
     """
+    if not _initialized:
+        _connect()
     if db is None:
         raise Exception("Database not connected. Please check MongoDB connection.")
     return db
@@ -1,23 +1,16 @@
 """
 Technical Indicators Package
 All indicators return pandas Series or DataFrame
+
+Submodules are loaded lazily (PEP 562): importing the package is cheap,
+and each indicator module is only parsed on first use.
 """
-from .adx import calculate_adx, get_adx_signal
-from .atr import calculate_atr
-from .bollinger import calculate_bollinger_bands, get_bollinger_signal
-from .macd import calculate_macd, get_macd_signal
-from .rsi import calculate_rsi, get_rsi_signal
-from .supertrend import calculate_supertrend, get_supertrend_signal
-from .renko import calculate_renko, get_renko_signal
-from .stochastic import calculate_stochastic, get_stochastic_signal
-from .ema import calculate_ema, calculate_multiple_emas, get_ema_signal
-from .sma import calculate_sma, calculate_multiple_smas, get_sma_signal, calculate_wma
-from .pivot_points import calculate_pivot_points, get_nearest_support_resistance, get_pivot_signal
+import importlib
 
 __all__ = [
     'calculate_adx', 'get_adx_signal',
     'calculate_atr',
-    'calculate_bollinger_bands', 'get_bollinger_signal',
+    'calculate_bollinger_bands', 'get_bollinger_signal', 'get_bollinger_signals_series',
     'calculate_macd', 'get_macd_signal',
     'calculate_rsi', 'get_rsi_signal',
     'calculate_supertrend', 'get_supertrend_signal',
@@ -26,6 +19,42 @@ __all__ = [
     'calculate_ema', 'calculate_multiple_emas', 'get_ema_signal',
     'calculate_sma', 'calculate_multiple_smas', 'get_sma_signal', 'calculate_wma',
     'calculate_pivot_points', 'get_nearest_support_resistance', 'get_pivot_signal',
+    'get_pivot_signal_batch',
+    'EMAState', 'MACDState', 'SupertrendState',
+    'RSIState', 'ATRState', 'BollingerState',
 ]
 
+# exported name -> defining submodule
+_lazy = {
+    'calculate_adx': 'adx', 'get_adx_signal': 'adx',
+    'calculate_atr': 'atr',
+    'calculate_bollinger_bands': 'bollinger', 'get_bollinger_signal': 'bollinger',
+    'get_bollinger_signals_series': 'bollinger',
+    'calculate_macd': 'macd', 'get_macd_signal': 'macd',
+    'calculate_rsi': 'rsi', 'get_rsi_signal': 'rsi',
+    'calculate_supertrend': 'supertrend', 'get_supertrend_signal': 'supertrend',
+    'calculate_renko': 'renko', 'get_renko_signal': 'renko',
+    'calculate_stochastic': 'stochastic', 'get_stochastic_signal': 'stochastic',
+    'calculate_ema': 'ema', 'calculate_multiple_emas': 'ema', 'get_ema_signal': 'ema',
+    'calculate_sma': 'sma', 'calculate_multiple_smas': 'sma',
+    'get_sma_signal': 'sma', 'calculate_wma': 'sma',
+    'calculate_pivot_points': 'pivot_points',
+    'get_nearest_support_resistance': 'pivot_points',
+    'get_pivot_signal': 'pivot_points',
+    'get_pivot_signal_batch': 'pivot_points',
+    'EMAState': 'streaming', 'MACDState': 'streaming', 'SupertrendState': 'streaming',
+    'RSIState': 'streaming', 'ATRState': 'streaming', 'BollingerState': 'streaming',
+}
+
+
+def __getattr__(name):
+    if name in _lazy:
+        module = importlib.import_module(f'.{_lazy[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
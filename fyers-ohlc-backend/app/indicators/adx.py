@@ -2,50 +2,77 @@
 Average Directional Index (ADX) Indicator
 Measures trend strength without regard to direction
 """
+import math
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
 
 
+from .cache import indicator_cache
+
+
+def _wilder_smooth(arr: np.ndarray, index: pd.Index, period: int) -> np.ndarray:
+    """Wilder's smoothing (EWM with alpha = 1/period) via pandas' compiled kernel."""
+    smoothed = pd.Series(arr, index=index).ewm(alpha=1.0 / period, adjust=False, min_periods=period).mean()
+    return smoothed.to_numpy()
+
+
+@indicator_cache
 def calculate_adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
     """
     Calculate Average Directional Index (ADX).
-    
+
     Args:
         df: DataFrame with columns ['open', 'high', 'low', 'close']
         period: Period for ADX calculation (default: 14)
-    
+
     Returns:
         Series with ADX values
     """
-    high = df['high']
-    low = df['low']
-    close = df['close']
-    
-    # Calculate True Range
-    tr1 = high - low
-    tr2 = abs(high - close.shift())
-    tr3 = abs(low - close.shift())
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    
-    # Calculate Directional Movement
-    plus_dm = high.diff()
-    minus_dm = -low.diff()
-    
-    plus_dm[plus_dm < 0] = 0
-    minus_dm[minus_dm < 0] = 0
-    
-    # Calculate Directional Indicators
-    atr = tr.rolling(window=period).mean()
-    plus_di = 100 * (plus_dm.rolling(window=period).mean() / atr)
-    minus_di = 100 * (minus_dm.rolling(window=period).mean() / atr)
-    
-    # Calculate DX
-    dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
-    
-    # Calculate ADX
-    adx = dx.rolling(window=period).mean()
-    
-    return adx
+    # Single columnar pass: TR, +DM/-DM, DI, DX and ADX are all computed
+    # on raw float64 arrays; only the final result is wrapped in a Series.
+    h = df['high'].to_numpy(dtype=np.float64)
+    l = df['low'].to_numpy(dtype=np.float64)
+    c = df['close'].to_numpy(dtype=np.float64)
+    n = len(h)
+
+    # True Range as a three-way maximum
+    prev_close = np.empty(n, dtype=np.float64)
+    prev_close[0] = np.nan
+    prev_close[1:] = c[:-1]
+
+    tr_arr = np.maximum(h - l, np.maximum(np.abs(h - prev_close), np.abs(l - prev_close)))
+    if n:
+        tr_arr[0] = h[0] - l[0]
+
+    # Directional Movement per Wilder: only the larger of the up/down
+    # move counts, and only when positive (first bar stays NaN)
+    up = np.empty(n, dtype=np.float64)
+    down = np.empty(n, dtype=np.float64)
+    up[0] = down[0] = np.nan
+    up[1:] = h[1:] - h[:-1]
+    down[1:] = l[:-1] - l[1:]
+
+    plus_dm = np.where((up > down) & (up > 0), up, 0.0)
+    minus_dm = np.where((down > up) & (down > 0), down, 0.0)
+    if n:
+        plus_dm[0] = minus_dm[0] = np.nan
+
+    # Directional Indicators with Wilder's smoothing
+    atr = _wilder_smooth(tr_arr, df.index, period)
+    plus_di = 100 * (_wilder_smooth(plus_dm, df.index, period) / atr)
+    minus_di = 100 * (_wilder_smooth(minus_dm, df.index, period) / atr)
+
+    # DX with a masked divide: 0 when both DIs are zero, NaN while the
+    # DIs are still warming up, no Inf/NaN propagation from the division
+    denom = plus_di + minus_di
+    dx = np.where(np.isnan(denom), np.nan, 0.0)
+    np.divide(np.abs(plus_di - minus_di) * 100, denom, out=dx, where=denom > 0)
+
+    adx = _wilder_smooth(dx, df.index, period)
+
+    return pd.Series(adx, index=df.index)
 
 
 def get_adx_signal(adx: pd.Series, threshold_strong: float = 25, threshold_weak: float = 20) -> str:
@@ -60,11 +87,16 @@ def get_adx_signal(adx: pd.Series, threshold_strong: float = 25, threshold_weak:
     Returns:
         Signal string: 'STRONG_TREND', 'WEAK_TREND', or 'SIDEWAYS'
     """
-    if pd.isna(adx.iloc[-1]):
+    current_adx = float(adx.iat[-1])
+    if math.isnan(current_adx):
         return 'INSUFFICIENT_DATA'
-    
-    current_adx = adx.iloc[-1]
-    
+
+    return _classify_adx(current_adx, threshold_strong, threshold_weak)
+
+
+@lru_cache(maxsize=256)
+def _classify_adx(current_adx: float, threshold_strong: float, threshold_weak: float) -> str:
+    """Pure classification on hashable scalars; cached for repeat calls on an unchanged bar."""
     if current_adx > threshold_strong:
         return 'STRONG_TREND'
     elif current_adx < threshold_weak:
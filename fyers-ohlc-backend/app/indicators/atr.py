@@ -5,7 +5,10 @@ Measures market volatility
 import pandas as pd
 import numpy as np
 
+from .cache import indicator_cache
 
+
+@indicator_cache
 def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
     """
     Calculate Average True Range (ATR).
@@ -17,19 +20,23 @@ def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
     Returns:
         Series with ATR values
     """
-    high = df['high']
-    low = df['low']
-    close = df['close']
-    
-    # Calculate True Range
-    tr1 = high - low
-    tr2 = abs(high - close.shift())
-    tr3 = abs(low - close.shift())
-    
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    high = df['high'].to_numpy()
+    low = df['low'].to_numpy()
+    close = df['close'].to_numpy()
+
+    # Calculate True Range as a three-way maximum on raw arrays
+    # (avoids the DataFrame built by pd.concat(...).max(axis=1))
+    prev_close = np.empty(len(close), dtype=np.float64)
+    prev_close[0] = np.nan
+    prev_close[1:] = close[:-1]
+
+    tr_arr = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+    if len(tr_arr):
+        tr_arr[0] = high[0] - low[0]
+    tr = pd.Series(tr_arr, index=df.index)
     
-    # Calculate ATR as moving average of TR
-    atr = tr.rolling(window=period).mean()
+    # Calculate ATR with Wilder's smoothing (EWM with alpha = 1/period)
+    atr = tr.ewm(alpha=1.0 / period, adjust=False, min_periods=period).mean()
     
     return atr
 
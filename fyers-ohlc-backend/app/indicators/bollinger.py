@@ -2,10 +2,16 @@
 Bollinger Bands Indicator
 Volatility bands placed above and below a moving average
 """
+import math
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
 
+from .cache import indicator_cache
+
 
+@indicator_cache
 def calculate_bollinger_bands(df: pd.DataFrame, period: int = 20, std_dev: float = 2.0) -> pd.DataFrame:
     """
     Calculate Bollinger Bands.
@@ -19,23 +25,23 @@ def calculate_bollinger_bands(df: pd.DataFrame, period: int = 20, std_dev: float
         DataFrame with columns: 'upper_band', 'middle_band', 'lower_band'
     """
     close = df['close']
-    
-    # Calculate middle band (SMA)
-    middle_band = close.rolling(window=period).mean()
-    
-    # Calculate standard deviation
-    std = close.rolling(window=period).std()
-    
-    # Calculate upper and lower bands
-    upper_band = middle_band + (std * std_dev)
-    lower_band = middle_band - (std * std_dev)
-    
+
+    # Calculate mean and standard deviation in one rolling pass
+    stats = close.rolling(window=period).agg(['mean', 'std'])
+    middle_band = stats['mean'].to_numpy()
+    std = stats['std'].to_numpy()
+
+    # Band arithmetic on raw arrays, wrapped in a DataFrame once
+    offset = std * std_dev
+    upper_band = middle_band + offset
+    lower_band = middle_band - offset
+
     result = pd.DataFrame({
         'upper_band': upper_band,
         'middle_band': middle_band,
         'lower_band': lower_band
-    })
-    
+    }, index=df.index)
+
     return result
 
 
@@ -54,14 +60,19 @@ def get_bollinger_signal(df: pd.DataFrame, bb: pd.DataFrame, tolerance: float =
     if len(df) == 0 or len(bb) == 0:
         return 'INSUFFICIENT_DATA'
     
-    current_price = df['close'].iloc[-1]
-    upper_band = bb['upper_band'].iloc[-1]
-    lower_band = bb['lower_band'].iloc[-1]
-    middle_band = bb['middle_band'].iloc[-1]
-    
-    if pd.isna(current_price) or pd.isna(upper_band) or pd.isna(lower_band):
+    current_price = float(df['close'].iat[-1])
+    upper_band = float(bb['upper_band'].iat[-1])
+    lower_band = float(bb['lower_band'].iat[-1])
+
+    if math.isnan(current_price) or math.isnan(upper_band) or math.isnan(lower_band):
         return 'INSUFFICIENT_DATA'
-    
+
+    return _classify_bollinger(current_price, upper_band, lower_band, tolerance)
+
+
+@lru_cache(maxsize=256)
+def _classify_bollinger(current_price: float, upper_band: float, lower_band: float, tolerance: float) -> str:
+    """Pure classification on hashable scalars; cached for repeat calls on an unchanged bar."""
     # Check if price touches lower band (potential buy)
     if current_price <= lower_band * (1 + tolerance):
         return 'BUY'
@@ -72,3 +83,32 @@ def get_bollinger_signal(df: pd.DataFrame, bb: pd.DataFrame, tolerance: float =
         return 'HOLD'
 
 
+def get_bollinger_signals_series(df: pd.DataFrame, bb: pd.DataFrame, tolerance: float = 0.01) -> pd.Series:
+    """
+    Generate Bollinger signals for every bar in one vectorized pass.
+
+    Args:
+        df: Original DataFrame with 'close' column
+        bb: Bollinger Bands DataFrame
+        tolerance: Price proximity tolerance to band (default: 0.01 = 1%)
+
+    Returns:
+        Series of 'BUY'/'SELL'/'HOLD' per bar ('INSUFFICIENT_DATA' where
+        the bands are still NaN)
+    """
+    close = df['close'].to_numpy(dtype=np.float64)
+    upper = bb['upper_band'].to_numpy(dtype=np.float64)
+    lower = bb['lower_band'].to_numpy(dtype=np.float64)
+
+    invalid = np.isnan(close) | np.isnan(upper) | np.isnan(lower)
+    buy = close <= lower * (1 + tolerance)
+    sell = close >= upper * (1 - tolerance)
+
+    signals = np.select(
+        [invalid, buy, sell],
+        ['INSUFFICIENT_DATA', 'BUY', 'SELL'],
+        default='HOLD'
+    )
+    return pd.Series(signals, index=df.index)
+
+
@@ -0,0 +1,57 @@
+"""
+Lightweight memoization for indicator functions
+Strategies and signal generators tend to recompute the same indicator on
+the same OHLC frame many times per bar; caching the full result per
+(frame, params) turns those repeat calls into dictionary lookups
+"""
+import weakref
+from collections import OrderedDict
+from functools import wraps
+
+_MAX_ENTRIES = 128
+
+# key -> cached indicator result (Series or DataFrame)
+_results = OrderedDict()
+
+# id(df) -> df; identity check guards against id() reuse after gc
+_frames = weakref.WeakValueDictionary()
+
+
+def _frame_key(df):
+    """Cheap fingerprint of a DataFrame: identity, length and last index value."""
+    if len(df) > 0:
+        last = df.index[-1]
+        last = getattr(last, 'value', last)  # Timestamp -> int nanoseconds
+    else:
+        last = None
+    return (id(df), len(df), last)
+
+
+def indicator_cache(func):
+    """
+    Memoize an indicator function whose first argument is the OHLC DataFrame.
+
+    The cache key is (function, df identity, df length, last index value,
+    remaining arguments), so appending bars or passing different parameters
+    recomputes while repeat calls on an unchanged frame are O(1).
+    """
+    @wraps(func)
+    def wrapper(df, *args, **kwargs):
+        key = (func.__name__, _frame_key(df), args, tuple(sorted(kwargs.items())))
+
+        if _frames.get(id(df)) is df:
+            cached = _results.get(key)
+            if cached is not None:
+                _results.move_to_end(key)
+                return cached
+
+        result = func(df, *args, **kwargs)
+
+        _frames[id(df)] = df
+        _results[key] = result
+        while len(_results) > _MAX_ENTRIES:
+            _results.popitem(last=False)
+
+        return result
+
+    return wrapper
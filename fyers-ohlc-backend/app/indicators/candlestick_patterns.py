@@ -3,99 +3,160 @@ import pandas as pd
 from typing import Tuple, Dict, Any, List, Optional
 # Use pandas to compute ATR instead of relying on external talib
 
+def _candle_anatomy(ohlc_df: pd.DataFrame) -> Tuple[np.ndarray, ...]:
+    """
+    Shared per-candle geometry as contiguous float64 arrays.
+
+    Returns (open, close, body, total_range, upper_wick, lower_wick);
+    np.maximum/np.minimum replace the DataFrame .max(axis=1) reductions
+    the individual detectors used to re-do per call.
+    """
+    o = ohlc_df['open'].to_numpy(dtype=np.float64)
+    h = ohlc_df['high'].to_numpy(dtype=np.float64)
+    l = ohlc_df['low'].to_numpy(dtype=np.float64)
+    c = ohlc_df['close'].to_numpy(dtype=np.float64)
+
+    body = np.abs(c - o)
+    total_range = h - l
+    upper_wick = h - np.maximum(o, c)
+    lower_wick = np.minimum(o, c) - l
+    return o, c, body, total_range, upper_wick, lower_wick
+
+
+def _masked_reciprocal(arr: np.ndarray) -> np.ndarray:
+    """1/arr where arr > 0, else 0 — a degenerate (zero) denominator yields
+    ratio 0, so every ratio below becomes one multiply with no epsilon temp."""
+    out = np.zeros_like(arr)
+    np.divide(1.0, arr, out=out, where=arr > 0)
+    return out
+
+
 def detect_doji(ohlc_df: pd.DataFrame, threshold: float = 0.1) -> pd.Series:
     """
     Detect Doji candlestick pattern.
     A Doji has a very small body relative to the total range.
-    
+
     Args:
         ohlc_df: DataFrame with OHLC data
         threshold: Maximum body to range ratio to be considered a Doji (default: 0.1)
-        
+
     Returns:
         pd.Series: Boolean series indicating Doji pattern
     """
-    body_size = np.abs(ohlc_df['close'] - ohlc_df['open'])
-    total_range = ohlc_df['high'] - ohlc_df['low']
-    is_doji = (body_size / (total_range + 1e-8)) < threshold
-    return is_doji
+    _, _, body, total_range, _, _ = _candle_anatomy(ohlc_df)
+    is_doji = body * _masked_reciprocal(total_range) < threshold
+    return pd.Series(is_doji, index=ohlc_df.index)
 
 def detect_hammer(ohlc_df: pd.DataFrame, body_threshold: float = 0.3, lower_wick_ratio: float = 2.0) -> pd.Series:
     """
     Detect Hammer candlestick pattern (bullish reversal).
-    
+
     Args:
         ohlc_df: DataFrame with OHLC data
         body_threshold: Maximum body to total range ratio (default: 0.3)
         lower_wick_ratio: Minimum lower wick to body ratio (default: 2.0)
-        
+
     Returns:
         pd.Series: Boolean series indicating Hammer pattern
     """
-    body_size = np.abs(ohlc_df['close'] - ohlc_df['open'])
-    total_range = ohlc_df['high'] - ohlc_df['low']
-    
-    # Calculate wick sizes
-    upper_wick = ohlc_df['high'] - ohlc_df[['open', 'close']].max(axis=1)
-    lower_wick = ohlc_df[['open', 'close']].min(axis=1) - ohlc_df['low']
-    
+    _, _, body, total_range, upper_wick, lower_wick = _candle_anatomy(ohlc_df)
+
     # Hammer conditions
-    small_body = (body_size / (total_range + 1e-8)) < body_threshold
-    long_lower_wick = (lower_wick / (body_size + 1e-8)) > lower_wick_ratio
-    small_upper_wick = upper_wick < body_size
-    
-    return small_body & long_lower_wick & small_upper_wick
+    small_body = body * _masked_reciprocal(total_range) < body_threshold
+    long_lower_wick = lower_wick * _masked_reciprocal(body) > lower_wick_ratio
+    small_upper_wick = upper_wick < body
+
+    return pd.Series(small_body & long_lower_wick & small_upper_wick, index=ohlc_df.index)
 
 def detect_shooting_star(ohlc_df: pd.DataFrame, body_threshold: float = 0.3, upper_wick_ratio: float = 2.0) -> pd.Series:
     """
     Detect Shooting Star candlestick pattern (bearish reversal).
-    
+
     Args:
         ohlc_df: DataFrame with OHLC data
         body_threshold: Maximum body to total range ratio (default: 0.3)
         upper_wick_ratio: Minimum upper wick to body ratio (default: 2.0)
-        
+
     Returns:
         pd.Series: Boolean series indicating Shooting Star pattern
     """
-    body_size = np.abs(ohlc_df['close'] - ohlc_df['open'])
-    total_range = ohlc_df['high'] - ohlc_df['low']
-    
-    # Calculate wick sizes
-    upper_wick = ohlc_df['high'] - ohlc_df[['open', 'close']].max(axis=1)
-    lower_wick = ohlc_df[['open', 'close']].min(axis=1) - ohlc_df['low']
-    
+    _, _, body, total_range, upper_wick, lower_wick = _candle_anatomy(ohlc_df)
+
     # Shooting Star conditions
-    small_body = (body_size / (total_range + 1e-8)) < body_threshold
-    long_upper_wick = (upper_wick / (body_size + 1e-8)) > upper_wick_ratio
-    small_lower_wick = lower_wick < body_size
-    
-    return small_body & long_upper_wick & small_lower_wick
+    small_body = body * _masked_reciprocal(total_range) < body_threshold
+    long_upper_wick = upper_wick * _masked_reciprocal(body) > upper_wick_ratio
+    small_lower_wick = lower_wick < body
+
+    return pd.Series(small_body & long_upper_wick & small_lower_wick, index=ohlc_df.index)
 
 def detect_marubozu(ohlc_df: pd.DataFrame, wick_threshold: float = 0.1) -> Tuple[pd.Series, pd.Series]:
     """
     Detect Marubozu candlestick patterns (bullish and bearish).
-    
+
     Args:
         ohlc_df: DataFrame with OHLC data
         wick_threshold: Maximum wick to body ratio (default: 0.1)
-        
+
     Returns:
         Tuple[pd.Series, pd.Series]: Two boolean series for bullish and bearish Marubozu patterns
     """
-    body_size = np.abs(ohlc_df['close'] - ohlc_df['open'])
-    total_range = ohlc_df['high'] - ohlc_df['low']
-    
-    # Calculate wick sizes
-    upper_wick = ohlc_df['high'] - ohlc_df[['open', 'close']].max(axis=1)
-    lower_wick = ohlc_df[['open', 'close']].min(axis=1) - ohlc_df['low']
-    
+    o, c, body, _, upper_wick, lower_wick = _candle_anatomy(ohlc_df)
+
     # Marubozu conditions
-    small_wicks = (upper_wick + lower_wick) / (body_size + 1e-8) < wick_threshold
-    bullish = (ohlc_df['close'] > ohlc_df['open']) & small_wicks
-    bearish = (ohlc_df['close'] < ohlc_df['open']) & small_wicks
-    
-    return bullish, bearish
+    small_wicks = (upper_wick + lower_wick) * _masked_reciprocal(body) < wick_threshold
+    bullish = (c > o) & small_wicks
+    bearish = (c < o) & small_wicks
+
+    return pd.Series(bullish, index=ohlc_df.index), pd.Series(bearish, index=ohlc_df.index)
+
+def detect_all_patterns(
+    ohlc_df: pd.DataFrame,
+    doji_threshold: float = 0.1,
+    body_threshold: float = 0.3,
+    wick_ratio: float = 2.0,
+    marubozu_wick_threshold: float = 0.1
+) -> Dict[str, pd.Series]:
+    """
+    Detect all single-candle patterns in one pass over the OHLC columns.
+
+    Computes the shared candle geometry once instead of per detector, so
+    the frame is streamed from memory a single time.
+
+    Returns:
+        Dict with boolean Series: 'doji', 'hammer', 'shooting_star',
+        'bullish_marubozu', 'bearish_marubozu'
+    """
+    o, c, body, total_range, upper_wick, lower_wick = _candle_anatomy(ohlc_df)
+
+    inv_range = _masked_reciprocal(total_range)
+    inv_body = _masked_reciprocal(body)
+
+    # Ratio arithmetic recycles two scratch buffers via out= so the whole
+    # pass allocates a fixed number of arrays regardless of detector count
+    body_range_ratio = np.multiply(body, inv_range, out=inv_range)
+    small_body = body_range_ratio < body_threshold
+    is_doji = body_range_ratio < doji_threshold
+
+    scratch = np.multiply(lower_wick, inv_body)
+    is_hammer = small_body & (scratch > wick_ratio) & (upper_wick < body)
+
+    np.multiply(upper_wick, inv_body, out=scratch)
+    is_shooting_star = small_body & (scratch > wick_ratio) & (lower_wick < body)
+
+    np.add(upper_wick, lower_wick, out=scratch)
+    np.multiply(scratch, inv_body, out=scratch)
+    small_wicks = scratch < marubozu_wick_threshold
+    bullish_marubozu = (c > o) & small_wicks
+    bearish_marubozu = (c < o) & small_wicks
+
+    index = ohlc_df.index
+    return {
+        'doji': pd.Series(is_doji, index=index),
+        'hammer': pd.Series(is_hammer, index=index),
+        'shooting_star': pd.Series(is_shooting_star, index=index),
+        'bullish_marubozu': pd.Series(bullish_marubozu, index=index),
+        'bearish_marubozu': pd.Series(bearish_marubozu, index=index),
+    }
 
 def detect_engulfing(ohlc_df: pd.DataFrame) -> tuple:
     """
@@ -157,19 +218,23 @@ def calculate_support_resistance(ohlc_df: pd.DataFrame, window: int = 20) -> Dic
     """
     if len(ohlc_df) < window:
         window = len(ohlc_df)
-        
+
+    # One block extraction of the last bar instead of six .iloc[-1] calls
+    high, low, close = ohlc_df[['high', 'low', 'close']].to_numpy()[-1]
+
     # Pivot Point (PP)
-    pp = (ohlc_df['high'].iloc[-1] + ohlc_df['low'].iloc[-1] + ohlc_df['close'].iloc[-1]) / 3
-    
+    pp = (high + low + close) / 3
+
     # Standard support and resistance levels
-    r1 = 2 * pp - ohlc_df['low'].iloc[-1]
-    s1 = 2 * pp - ohlc_df['high'].iloc[-1]
-    r2 = pp + (ohlc_df['high'].iloc[-1] - ohlc_df['low'].iloc[-1])
-    s2 = pp - (ohlc_df['high'].iloc[-1] - ohlc_df['low'].iloc[-1])
-    
-    # Recent price action levels
-    recent_high = ohlc_df['high'].rolling(window=window).max().iloc[-1]
-    recent_low = ohlc_df['low'].rolling(window=window).min().iloc[-1]
+    r1 = 2 * pp - low
+    s1 = 2 * pp - high
+    r2 = pp + (high - low)
+    s2 = pp - (high - low)
+
+    # Recent price action levels: only the trailing window matters, so
+    # reduce the tail slice directly rather than rolling the full history
+    recent_high = ohlc_df['high'].to_numpy()[-window:].max()
+    recent_low = ohlc_df['low'].to_numpy()[-window:].min()
     
     return {
         'pivot_point': pp,
@@ -194,14 +259,14 @@ def detect_trend(ohlc_df: pd.DataFrame, period: int = 20) -> str:
     """
     if len(ohlc_df) < period:
         return 'insufficient_data'
-        
-    # Calculate moving averages
-    ma = ohlc_df['close'].rolling(window=period).mean()
-    
-    # Determine trend based on price position relative to MA and MA slope
-    last_price = ohlc_df['close'].iloc[-1]
-    last_ma = ma.iloc[-1]
-    prev_ma = ma.iloc[-2] if len(ma) > 1 else last_ma
+
+    # Only the last two moving-average values matter, so reduce the two
+    # trailing slices directly instead of rolling the whole history
+    cls = ohlc_df['close'].to_numpy()
+    last_ma = cls[-period:].mean()
+    # one bar earlier needs period+1 rows; matches the NaN the rolling
+    # window produced at that position on shorter frames
+    prev_ma = cls[-period - 1:-1].mean() if len(cls) > period else np.nan
     
     if last_ma > prev_ma * 1.001:  # Uptrend if MA is rising
         return 'uptrend'
@@ -210,62 +275,136 @@ def detect_trend(ohlc_df: pd.DataFrame, period: int = 20) -> str:
     else:
         return 'sideways'  # Sideways if MA is flat
 
+def _rolling_mean(arr: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling mean with min_periods=1 semantics via one cumulative sum.
+
+    Valid for NaN-free input (True Range is, after the first-bar
+    fallback); a single cumsum plus a shifted difference replaces the
+    generic pandas rolling dispatch.
+    """
+    csum = np.cumsum(arr)
+    out = np.empty_like(csum)
+    head = min(window, len(arr))
+    out[:head] = csum[:head] / np.arange(1, head + 1)
+    if len(arr) > window:
+        out[window:] = (csum[window:] - csum[:-window]) / window
+    return out
+
+
 def calculate_atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
     """Calculate Average True Range (ATR) for volatility measurement."""
     # True Range = max(high-low, abs(high - prev_close), abs(low - prev_close))
-    prev_close = close.shift(1)
-    tr1 = high - low
-    tr2 = (high - prev_close).abs()
-    tr3 = (low - prev_close).abs()
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    atr = true_range.rolling(window=period, min_periods=1).mean()
-    return atr
+    # as a three-way np.maximum on raw arrays instead of concatenating a
+    # throwaway 3-column frame and reducing it row-wise
+    h = high.to_numpy(dtype=np.float64)
+    l = low.to_numpy(dtype=np.float64)
+    c = close.to_numpy(dtype=np.float64)
+
+    prev_close = np.empty(len(c), dtype=np.float64)
+    prev_close[0] = np.nan
+    prev_close[1:] = c[:-1]
+
+    tr = np.maximum(np.maximum(h - l, np.abs(h - prev_close)), np.abs(l - prev_close))
+    if len(tr):
+        # first bar has no previous close; the old skipna row-max fell back to high-low
+        tr[0] = h[0] - l[0]
+
+    return pd.Series(_rolling_mean(tr, period), index=close.index)
+
+def _supertrend_core(close: np.ndarray, upper: np.ndarray, lower: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Supertrend recurrence on raw float64 arrays.
+
+    Returns (supertrend, direction) ndarrays; direction is +1/-1.
+    """
+    n = len(close)
+    st = np.full(n, np.nan)
+    dirn = np.ones(n, dtype=np.int64)
+
+    for i in range(1, n):
+        st_prev = st[i - 1]
+        close_prev = close[i - 1]
+
+        if close_prev > st_prev:
+            d = 1
+        elif close_prev < st_prev:
+            d = -1
+        else:
+            d = dirn[i - 1]
+        dirn[i] = d
+
+        if d < 0 and upper[i] < st_prev:
+            st[i] = upper[i]
+        elif d > 0 and lower[i] > st_prev:
+            st[i] = lower[i]
+        elif d < 0:
+            st[i] = st_prev if st_prev < upper[i] else upper[i]
+        else:
+            st[i] = st_prev if st_prev > lower[i] else lower[i]
+
+    return st, dirn
+
 
 def calculate_supertrend(
     high: pd.Series,
     low: pd.Series,
     close: pd.Series,
     atr_period: int = 10,
-    multiplier: float = 3.0
+    multiplier: float = 3.0,
+    atr: pd.Series = None
 ) -> Tuple[pd.Series, pd.Series, pd.Series, pd.Series]:
     """
     Calculate Supertrend indicator.
-    
+
+    Args:
+        atr: Precomputed ATR for atr_period; calculated here when None.
+            Callers sweeping several multipliers over one period can pass
+            it in to avoid recomputing the same ATR per multiplier.
+
     Returns:
         Tuple of (supertrend, direction, upper_band, lower_band)
     """
     # Calculate ATR
-    atr = calculate_atr(high, low, close, atr_period)
-    
+    if atr is None:
+        atr = calculate_atr(high, low, close, atr_period)
+
     # Basic upper and lower bands
     hl2 = (high + low) / 2
     upper_band = hl2 + (multiplier * atr)
     lower_band = hl2 - (multiplier * atr)
-    
-    # Initialize columns
-    supertrend = pd.Series(index=close.index, dtype='float64')
-    direction = pd.Series(1, index=close.index)
-    
-    for i in range(1, len(close)):
-        if close.iloc[i-1] > supertrend.iloc[i-1]:
-            direction.iloc[i] = 1
-        elif close.iloc[i-1] < supertrend.iloc[i-1]:
-            direction.iloc[i] = -1
-        else:
-            direction.iloc[i] = direction.iloc[i-1]
-            
-        if direction.iloc[i] < 0 and upper_band.iloc[i] < supertrend.iloc[i-1]:
-            supertrend.iloc[i] = upper_band.iloc[i]
-        elif direction.iloc[i] > 0 and lower_band.iloc[i] > supertrend.iloc[i-1]:
-            supertrend.iloc[i] = lower_band.iloc[i]
-        else:
-            if direction.iloc[i] < 0:
-                supertrend.iloc[i] = min(upper_band.iloc[i], supertrend.iloc[i-1])
-            else:
-                supertrend.iloc[i] = max(lower_band.iloc[i], supertrend.iloc[i-1])
-    
+
+    # Run the recurrence on raw arrays; only the results get wrapped
+    # back into Series (per-element .iloc access dominated this loop)
+    st, dirn = _supertrend_core(
+        close.to_numpy(dtype=np.float64),
+        upper_band.to_numpy(dtype=np.float64),
+        lower_band.to_numpy(dtype=np.float64),
+    )
+    supertrend = pd.Series(st, index=close.index)
+    direction = pd.Series(dirn, index=close.index)
+
     return supertrend, direction, upper_band, lower_band
 
+def _nearest_levels(levels: Dict[str, Any], current_close: float) -> Tuple[float, float]:
+    """
+    Nearest support below and resistance above the current price.
+
+    Masked numpy reductions over the three candidate levels on each side;
+    falls back to the extreme level when price sits outside all of them
+    (same fallback the old list comprehensions used).
+    """
+    supports = np.array([levels['support1'], levels['support2'], levels['recent_low']])
+    resistances = np.array([levels['resistance1'], levels['resistance2'], levels['recent_high']])
+
+    below = supports[supports < current_close]
+    above = resistances[resistances > current_close]
+
+    nearest_support = float(below.max()) if below.size else float(supports.min())
+    nearest_resistance = float(above.min()) if above.size else float(resistances.max())
+    return nearest_support, nearest_resistance
+
+
 def generate_trading_signals(
     ohlc_df: pd.DataFrame,
     atr_periods: List[int] = [7, 14, 21],
@@ -280,26 +419,47 @@ def generate_trading_signals(
     if ohlc_df.empty or len(ohlc_df) < max(atr_periods) * 2:
         return {"error": "Insufficient data for analysis"}
     
-    # Calculate multiple Supertrend indicators
-    signals = {}
-    for period in atr_periods:
-        for mult in multipliers:
-            _, direction, _, _ = calculate_supertrend(
-                ohlc_df['high'], ohlc_df['low'], ohlc_df['close'], period, mult
-            )
-            signals[f'supertrend_{period}_{mult}'] = direction
-    
-    # Combine signals
-    signals_df = pd.DataFrame(signals)
-    
-    # Generate final signal (1 for buy, -1 for sell, 0 for neutral)
-    signals_df['all_bullish'] = (signals_df > 0).all(axis=1).astype(int)
-    signals_df['all_bearish'] = (signals_df < 0).all(axis=1).astype(int) * -1
-    signals_df['signal'] = signals_df[['all_bullish', 'all_bearish']].sum(axis=1)
-    
-    # Add signal metadata
-    current_signal = signals_df['signal'].iloc[-1]
-    signal_strength = (signals_df == current_signal).mean().mean()
+    # Calculate multiple Supertrend indicators into a preallocated int8
+    # matrix (one row per period/multiplier combination)
+    n = len(ohlc_df)
+    combos = [(period, mult) for period in atr_periods for mult in multipliers]
+    dirs = np.empty((len(combos), n), dtype=np.int8)
+    # One ATR per period, shared across the multiplier sweep (the grid
+    # otherwise recomputes each ATR len(multipliers) times)
+    atr_by_period = {
+        period: calculate_atr(ohlc_df['high'], ohlc_df['low'], ohlc_df['close'], period)
+        for period in atr_periods
+    }
+    for k, (period, mult) in enumerate(combos):
+        _, direction, _, _ = calculate_supertrend(
+            ohlc_df['high'], ohlc_df['low'], ohlc_df['close'], period, mult,
+            atr=atr_by_period[period]
+        )
+        dirs[k] = direction.to_numpy()
+
+    # Generate final signal (1 for buy, 0 for neutral): a byte-wide min
+    # across rows replaces the DataFrame .all(axis=1). The original code
+    # computed all-bearishness after all_bullish had already been
+    # assigned into the frame, and the 0/1 all_bullish column is never
+    # negative, so all_bearish has always been structurally zero and the
+    # emitted signal never reads 'bearish'. Preserved as-is: consumers
+    # (services/trading_system.py) exit positions on 'bearish', and
+    # enabling that branch is a behavior change, not a perf refactor.
+    all_bullish = (dirs.min(axis=0) > 0).astype(np.int8)
+    all_bearish = np.zeros(n, dtype=np.int8)
+    signal_col = all_bullish + all_bearish
+
+    # Add signal metadata; strength is the overall fraction of matrix
+    # entries agreeing with the current signal, as before
+    current_signal = int(signal_col[-1])
+    full = np.vstack([dirs, all_bullish[None, :], all_bearish[None, :], signal_col[None, :]])
+    signal_strength = float((full == current_signal).mean())
+
+    supertrend_dict = {f'supertrend_{period}_{mult}': dirs[k].tolist()
+                       for k, (period, mult) in enumerate(combos)}
+    supertrend_dict['all_bullish'] = all_bullish.tolist()
+    supertrend_dict['all_bearish'] = all_bearish.tolist()
+    supertrend_dict['signal'] = signal_col.tolist()
     
     # Calculate position size (example values, adjust as needed)
     current_price = ohlc_df['close'].iloc[-1]
@@ -316,11 +476,7 @@ def generate_trading_signals(
     
     # Find nearest support/resistance
     current_close = ohlc_df['close'].iloc[-1]
-    support_levels = [levels['support1'], levels['support2'], levels['recent_low']]
-    resistance_levels = [levels['resistance1'], levels['resistance2'], levels['recent_high']]
-    
-    nearest_support = max([s for s in support_levels if s < current_close], default=min(support_levels, default=None))
-    nearest_resistance = min([r for r in resistance_levels if r > current_close], default=max(resistance_levels, default=None))
+    nearest_support, nearest_resistance = _nearest_levels(levels, current_close)
     
     # Calculate distances
     support_distance_pct = ((current_close - nearest_support) / nearest_support * 100) if nearest_support else None
@@ -339,7 +495,7 @@ def generate_trading_signals(
         'resistance_distance_pct': resistance_distance_pct,
         'timestamp': ohlc_df.index[-1],
         'indicators': {
-            'supertrend': signals_df.to_dict(orient='list')
+            'supertrend': supertrend_dict
         }
     }
 
@@ -385,30 +541,27 @@ def analyze_candlestick_patterns(ohlc_df: pd.DataFrame) -> Dict[str, Any]:
     if ohlc_df.empty or len(ohlc_df) < 2:
         return {"error": "Insufficient data for analysis"}
     
-    # Detect patterns
-    is_doji = detect_doji(ohlc_df)
-    is_hammer = detect_hammer(ohlc_df)
-    is_shooting_star = detect_shooting_star(ohlc_df)
-    is_bullish_marubozu, is_bearish_marubozu = detect_marubozu(ohlc_df)
-    
+    # Detect patterns in one shared-anatomy pass; only the last bar of
+    # each mask is consulted below
+    patterns = detect_all_patterns(ohlc_df)
+    last_doji = bool(patterns['doji'].iat[-1])
+    last_hammer = bool(patterns['hammer'].iat[-1])
+    last_shooting_star = bool(patterns['shooting_star'].iat[-1])
+    last_bullish_marubozu = bool(patterns['bullish_marubozu'].iat[-1])
+    last_bearish_marubozu = bool(patterns['bearish_marubozu'].iat[-1])
+
     # Get support/resistance levels
     levels = calculate_support_resistance(ohlc_df)
-    
+
     # Determine trend
     trend = detect_trend(ohlc_df)
-    
-    # Current price action
-    current_close = ohlc_df['close'].iloc[-1]
-    current_open = ohlc_df['open'].iloc[-1]
+
+    # Current price action: one block extraction instead of two .iloc calls
+    current_open, current_close = ohlc_df[['open', 'close']].to_numpy()[-1]
     is_bullish_candle = current_close > current_open
     
-    # Determine proximity to support/resistance
-    support_levels = [levels['support1'], levels['support2'], levels['recent_low']]
-    resistance_levels = [levels['resistance1'], levels['resistance2'], levels['recent_high']]
-    
     # Find nearest support and resistance
-    nearest_support = max([s for s in support_levels if s < current_close], default=min(support_levels, default=None))
-    nearest_resistance = min([r for r in resistance_levels if r > current_close], default=max(resistance_levels, default=None))
+    nearest_support, nearest_resistance = _nearest_levels(levels, current_close)
     
     # Calculate distance to support/resistance as percentage
     support_distance_pct = ((current_close - nearest_support) / nearest_support * 100) if nearest_support else None
@@ -419,24 +572,24 @@ def analyze_candlestick_patterns(ohlc_df: pd.DataFrame) -> Dict[str, Any]:
     signal_strength = "weak"
     
     # Check for bullish signals
-    if (is_hammer.iloc[-1] or is_bullish_marubozu.iloc[-1]) and \
+    if (last_hammer or last_bullish_marubozu) and \
        (support_distance_pct is not None and support_distance_pct < 1.0):
         signal = "bullish"
-        signal_strength = "strong" if is_bullish_marubozu.iloc[-1] else "moderate"
+        signal_strength = "strong" if last_bullish_marubozu else "moderate"
     # Check for bearish signals
-    elif (is_shooting_star.iloc[-1] or is_bearish_marubozu.iloc[-1]) and \
+    elif (last_shooting_star or last_bearish_marubozu) and \
          (resistance_distance_pct is not None and resistance_distance_pct < 1.0):
         signal = "bearish"
-        signal_strength = "strong" if is_bearish_marubozu.iloc[-1] else "moderate"
-    
+        signal_strength = "strong" if last_bearish_marubozu else "moderate"
+
     # Compile results
     result = {
         "patterns": {
-            "doji": bool(is_doji.iloc[-1]),
-            "hammer": bool(is_hammer.iloc[-1]),
-            "shooting_star": bool(is_shooting_star.iloc[-1]),
-            "bullish_marubozu": bool(is_bullish_marubozu.iloc[-1]),
-            "bearish_marubozu": bool(is_bearish_marubozu.iloc[-1])
+            "doji": last_doji,
+            "hammer": last_hammer,
+            "shooting_star": last_shooting_star,
+            "bullish_marubozu": last_bullish_marubozu,
+            "bearish_marubozu": last_bearish_marubozu
         },
         "levels": levels,
         "trend": trend,
@@ -4,7 +4,10 @@ Exponential Moving Average (EMA) Indicator
 import pandas as pd
 import numpy as np
 
+from .cache import indicator_cache
 
+
+@indicator_cache
 def calculate_ema(df: pd.DataFrame, period: int = 14, column: str = 'close') -> pd.Series:
     """
     Calculate Exponential Moving Average.
@@ -15,9 +18,11 @@ def calculate_ema(df: pd.DataFrame, period: int = 14, column: str = 'close') ->
         column: Column name to calculate EMA on (default: 'close')
     
     Returns:
-        Series with EMA values
+        Series with EMA values (float32)
     """
-    return df[column].ewm(span=period, adjust=False).mean()
+    # float32 is plenty for bar-data crossover logic and halves the
+    # memory traffic of the ewm pass
+    return df[column].astype(np.float32).ewm(span=period, adjust=False).mean().astype(np.float32)
 
 
 def calculate_multiple_emas(df: pd.DataFrame, periods: list = [9, 21, 50, 200]) -> pd.DataFrame:
@@ -5,7 +5,11 @@ Trend-following momentum indicator
 import pandas as pd
 import numpy as np
 
+from .cache import indicator_cache
+from .ema import calculate_ema
 
+
+@indicator_cache
 def calculate_macd(df: pd.DataFrame, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> pd.DataFrame:
     """
     Calculate MACD indicator.
@@ -19,27 +23,24 @@ def calculate_macd(df: pd.DataFrame, fast_period: int = 12, slow_period: int = 2
     Returns:
         DataFrame with columns: 'macd', 'signal', 'histogram'
     """
-    close = df['close']
-    
-    # Calculate EMAs
-    ema_fast = close.ewm(span=fast_period, adjust=False).mean()
-    ema_slow = close.ewm(span=slow_period, adjust=False).mean()
-    
-    # Calculate MACD line
-    macd = ema_fast - ema_slow
-    
-    # Calculate signal line
-    signal = macd.ewm(span=signal_period, adjust=False).mean()
-    
-    # Calculate histogram
-    histogram = macd - signal
-    
+    # EMAs come from the shared memoized calculate_ema, so a scan that
+    # already computed e.g. the 12/26 EMAs for crossover signals reuses
+    # them here instead of running fresh ewm passes
+    ema_fast = calculate_ema(df, fast_period)
+    ema_slow = calculate_ema(df, slow_period)
+
+    # MACD line, signal line and histogram on raw float32 arrays
+    macd_arr = ema_fast.to_numpy() - ema_slow.to_numpy()
+    signal = pd.Series(macd_arr, index=df.index).ewm(span=signal_period, adjust=False).mean()
+    signal_arr = signal.to_numpy().astype(np.float32)
+    histogram = macd_arr - signal_arr
+
     result = pd.DataFrame({
-        'macd': macd,
-        'signal': signal,
+        'macd': macd_arr,
+        'signal': signal_arr,
         'histogram': histogram
-    })
-    
+    }, index=df.index)
+
     return result
 
 
@@ -59,12 +60,12 @@ def get_macd_signal(macd_df: pd.DataFrame) -> str:
     macd = macd_df['macd']
     signal = macd_df['signal']
     
-    current_macd = macd.iloc[-1]
-    current_signal = signal.iloc[-1]
-    prev_macd = macd.iloc[-2]
-    prev_signal = signal.iloc[-2]
-    
-    if pd.isna(current_macd) or pd.isna(current_signal):
+    current_macd = float(macd.iat[-1])
+    current_signal = float(signal.iat[-1])
+    prev_macd = float(macd.iat[-2])
+    prev_signal = float(signal.iat[-2])
+
+    if current_macd != current_macd or current_signal != current_signal:  # NaN checks
         return 'INSUFFICIENT_DATA'
     
     # Bullish crossover: MACD crosses above signal
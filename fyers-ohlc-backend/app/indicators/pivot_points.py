@@ -124,30 +124,22 @@ def get_nearest_support_resistance(df: pd.DataFrame, current_price: float, metho
         Tuple of (nearest_support, nearest_resistance)
     """
     pivots = calculate_pivot_points(df, method)
-    
+
     if not pivots:
         return (None, None)
-    
-    # Extract all levels
-    levels = []
-    for key, value in pivots.items():
-        if key != 'pivot':
-            levels.append(value)
-        else:
-            levels.append(value)
-    
+
+    # Sort every level (pivot included) and bisect for the current price:
+    # levels strictly below sit left of the insertion point, levels
+    # strictly above start at the right-hand insertion point
+    levels = np.fromiter(pivots.values(), dtype=np.float64)
     levels.sort()
-    
-    # Find nearest support and resistance
-    resistance = None
-    support = None
-    
-    for level in levels:
-        if level > current_price and resistance is None:
-            resistance = level
-        if level < current_price:
-            support = level
-    
+
+    lo = np.searchsorted(levels, current_price, side='left')
+    hi = np.searchsorted(levels, current_price, side='right')
+
+    support = float(levels[lo - 1]) if lo > 0 else None
+    resistance = float(levels[hi]) if hi < len(levels) else None
+
     return (support, resistance)
 
 
@@ -180,3 +172,33 @@ def get_pivot_signal(df: pd.DataFrame, method: str = 'standard') -> str:
         return 'SELL'
     else:
         return 'NEUTRAL'
+
+
+def get_pivot_signal_batch(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                           current: np.ndarray) -> np.ndarray:
+    """
+    Vectorized standard-pivot signal for a batch of symbols.
+
+    Computes only pivot/S1/R1 (the levels the signal actually uses) as
+    branchless array arithmetic; one call replaces per-symbol
+    calculate_pivot_points + dict handling.
+
+    Args:
+        high, low, close: Previous-bar arrays, one entry per symbol
+        current: Current price per symbol
+
+    Returns:
+        int8 array of signals: 1 (BUY), -1 (SELL), 0 (NEUTRAL)
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    current = np.asarray(current, dtype=np.float64)
+
+    pivot = np.round((high + low + close) / 3, 2)
+    s1 = np.round(2 * pivot - high, 2)
+    r1 = np.round(2 * pivot - low, 2)
+
+    buy = (current > pivot) & (current > s1)
+    sell = (current < pivot) & (current < r1)
+    return buy.astype(np.int8) - sell.astype(np.int8)
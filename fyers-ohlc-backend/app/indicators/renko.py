@@ -25,76 +25,87 @@ def calculate_renko(df: pd.DataFrame, brick_size: float = None, atr_period: int
     # Determine brick size
     if brick_size is None:
         atr = calculate_atr(df, period=atr_period)
-        brick_size = atr.iloc[-1] * atr_multiplier
-        if pd.isna(brick_size) or brick_size == 0:
+        brick_size = float(atr.iat[-1]) * atr_multiplier
+        if brick_size != brick_size or brick_size == 0:  # NaN check
             brick_size = close.iloc[-1] * 0.01  # Fallback to 1% of price
     
-    # Initialize Renko data
-    renko_data = []
-    current_brick = None
-    trend = None  # 1 for up, -1 for down
-    
-    for i in range(len(df)):
-        price = close.iloc[i]
-        
-        if current_brick is None:
-            # First brick - round to nearest brick
-            current_brick = round(price / brick_size) * brick_size
-            trend = 1
-            renko_data.append({
-                'brick_price': current_brick,
-                'brick_type': 'up',
-                'trend': trend
-            })
-        else:
-            # Check if price moved enough for new brick
-            if trend == 1:  # Uptrend
-                if price >= current_brick + brick_size:
-                    # New up bricks
-                    while price >= current_brick + brick_size:
-                        current_brick += brick_size
-                        renko_data.append({
-                            'brick_price': current_brick,
-                            'brick_type': 'up',
-                            'trend': 1
-                        })
-                elif price <= current_brick - brick_size:
-                    # Reversal: new down brick
-                    current_brick -= brick_size
-                    trend = -1
-                    renko_data.append({
-                        'brick_price': current_brick,
-                        'brick_type': 'down',
-                        'trend': -1
-                    })
-            else:  # Downtrend
-                if price <= current_brick - brick_size:
-                    # New down bricks
-                    while price <= current_brick - brick_size:
-                        current_brick -= brick_size
-                        renko_data.append({
-                            'brick_price': current_brick,
-                            'brick_type': 'down',
-                            'trend': -1
-                        })
-                elif price >= current_brick + brick_size:
-                    # Reversal: new up brick
-                    current_brick += brick_size
-                    trend = 1
-                    renko_data.append({
-                        'brick_price': current_brick,
-                        'brick_type': 'up',
-                        'trend': 1
-                    })
-    
-    renko_df = pd.DataFrame(renko_data)
-    if len(renko_df) > 0:
-        # Create index based on number of bricks
-        renko_df.index = pd.RangeIndex(start=0, stop=len(renko_df))
-    
+    # Walk the brick state machine over a raw array; per-row .iloc reads
+    # and per-brick dicts dominated this loop. The recurrence itself is
+    # inherently sequential (each brick depends on the running brick and
+    # trend), so it stays a scalar loop, just without pandas in it.
+    brick_prices, trends = _renko_core(close.to_numpy(dtype=np.float64), brick_size)
+    if len(brick_prices) == 0:
+        return pd.DataFrame()
+
+    renko_df = pd.DataFrame({
+        'brick_price': brick_prices,
+        'brick_type': np.where(trends == 1, 'up', 'down'),
+        'trend': trends
+    })
+
     return renko_df
 
 
+def _renko_core(prices: np.ndarray, brick_size: float) -> tuple:
+    """
+    Renko brick recurrence; returns (brick_prices, trends) ndarrays.
+
+    Output goes into preallocated arrays written by index — every brick
+    moves the running level one brick toward the current price, so the
+    total brick count is bounded by the summed absolute price movement
+    plus one possible reversal per bar.
+    """
+    n = len(prices)
+    if n == 0:
+        return np.empty(0), np.empty(0, dtype=np.int8)
+
+    max_bricks = int(np.abs(np.diff(prices)).sum() / brick_size) + n + 4
+    brick_prices = np.empty(max_bricks)
+    trends = np.empty(max_bricks, dtype=np.int8)
+    count = 0
+
+    # First brick - round to nearest brick
+    current_brick = round(prices[0] / brick_size) * brick_size
+    trend = 1
+    brick_prices[count] = current_brick
+    trends[count] = trend
+    count += 1
+
+    for price in prices[1:]:
+        if trend == 1:  # Uptrend
+            if price >= current_brick + brick_size:
+                # New up bricks
+                while price >= current_brick + brick_size:
+                    current_brick += brick_size
+                    brick_prices[count] = current_brick
+                    trends[count] = 1
+                    count += 1
+            elif price <= current_brick - brick_size:
+                # Reversal: new down brick
+                current_brick -= brick_size
+                trend = -1
+                brick_prices[count] = current_brick
+                trends[count] = -1
+                count += 1
+        else:  # Downtrend
+            if price <= current_brick - brick_size:
+                # New down bricks
+                while price <= current_brick - brick_size:
+                    current_brick -= brick_size
+                    brick_prices[count] = current_brick
+                    trends[count] = -1
+                    count += 1
+            elif price >= current_brick + brick_size:
+                # Reversal: new up brick
+                current_brick += brick_size
+                trend = 1
+                brick_prices[count] = current_brick
+                trends[count] = 1
+                count += 1
+
+    return brick_prices[:count], trends[:count]
+
+
 def get_renko_signal(renko_df: pd.DataFrame, lookback: int = 3) -> str:
     """
     Generate signal based on Renko trend.
@@ -108,14 +119,13 @@ def get_renko_signal(renko_df: pd.DataFrame, lookback: int = 3) -> str:
     """
     if len(renko_df) < lookback:
         return 'INSUFFICIENT_DATA'
-    
-    recent_bricks = renko_df.tail(lookback)
-    recent_trends = recent_bricks['trend'].values
-    
-    # Check for consistent trend
-    if all(t == 1 for t in recent_trends):
+
+    # Check for consistent trend over the trailing bricks
+    recent_trends = renko_df['trend'].to_numpy()[-lookback:]
+
+    if (recent_trends == 1).all():
         return 'BULLISH'
-    elif all(t == -1 for t in recent_trends):
+    elif (recent_trends == -1).all():
         return 'BEARISH'
     else:
         return 'HOLD'
@@ -17,18 +17,29 @@ def calculate_rsi(df: pd.DataFrame, period: int = 14) -> pd.Series:
     Returns:
         Series with RSI values (0-100)
     """
-    close = df['close']
-    
+    close = df['close'].to_numpy(dtype=np.float64)
+
     # Calculate price changes
-    delta = close.diff()
-    
-    # Separate gains and losses
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
+    delta = np.empty(len(close), dtype=np.float64)
+    if len(close):
+        delta[0] = np.nan
+    delta[1:] = close[1:] - close[:-1]
+
+    # Branchless gain/loss split; the masked .where copies became two
+    # SIMD max passes. The first bar has no change, as before.
+    gain = np.maximum(delta, 0.0)
+    loss = np.maximum(-delta, 0.0)
+    if len(close):
+        gain[0] = loss[0] = 0.0
+
+    gain = pd.Series(gain, index=df.index)
+    loss = pd.Series(loss, index=df.index)
     
-    # Calculate average gain and loss
-    avg_gain = gain.rolling(window=period).mean()
-    avg_loss = loss.rolling(window=period).mean()
+    # Wilder's smoothing (EWM with alpha = 1/period): the canonical RSI
+    # recursion, and a single multiply-add per bar instead of a
+    # recomputed rolling window
+    avg_gain = gain.ewm(alpha=1.0 / period, adjust=False, min_periods=period).mean()
+    avg_loss = loss.ewm(alpha=1.0 / period, adjust=False, min_periods=period).mean()
     
     # Calculate RS and RSI
     rs = avg_gain / avg_loss
@@ -49,11 +60,11 @@ def get_rsi_signal(rsi: pd.Series, oversold: float = 30, overbought: float = 70)
     Returns:
         Signal string: 'OVERSOLD', 'OVERBOUGHT', or 'NEUTRAL'
     """
-    if pd.isna(rsi.iloc[-1]):
+    current_rsi = float(rsi.iat[-1])
+    if current_rsi != current_rsi:  # NaN check without pandas dispatch
         return 'INSUFFICIENT_DATA'
-    
-    current_rsi = rsi.iloc[-1]
-    
+
+
     if current_rsi < oversold:
         return 'OVERSOLD'  # Potential buy signal
     elif current_rsi > overbought:
@@ -1,23 +1,46 @@
 """
 Simple Moving Average (SMA) Indicator
 """
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
 
 
+@lru_cache(maxsize=64)
+def _wma_weights(period: int) -> np.ndarray:
+    """Normalized WMA kernel for a period; cached so per-bar refresh
+    loops reuse one ndarray instead of reallocating it every call."""
+    weights = np.arange(1, period + 1, dtype=np.float64)
+    return weights / weights.sum()
+
+
+def _sma_array(values: np.ndarray, period: int, csum: np.ndarray = None) -> np.ndarray:
+    """SMA as a shifted cumulative-sum difference (NaN warm-up prefix).
+
+    Pass a precomputed csum (np.cumsum with a leading 0) to share one
+    pass over the data across several periods."""
+    sma = np.full(len(values), np.nan)
+    if len(values) >= period:
+        if csum is None:
+            csum = np.concatenate(([0.0], np.cumsum(values)))
+        sma[period - 1:] = (csum[period:] - csum[:-period]) / period
+    return sma
+
+
 def calculate_sma(df: pd.DataFrame, period: int = 14, column: str = 'close') -> pd.Series:
     """
     Calculate Simple Moving Average.
-    
+
     Args:
         df: DataFrame with price data
         period: Period for SMA calculation (default: 14)
         column: Column name to calculate SMA on (default: 'close')
-    
+
     Returns:
         Series with SMA values
     """
-    return df[column].rolling(window=period).mean()
+    return pd.Series(_sma_array(df[column].to_numpy(dtype=np.float64), period), index=df.index)
 
 
 def calculate_multiple_smas(df: pd.DataFrame, periods: list = [10, 20, 50, 200]) -> pd.DataFrame:
@@ -31,12 +54,14 @@ def calculate_multiple_smas(df: pd.DataFrame, periods: list = [10, 20, 50, 200])
     Returns:
         DataFrame with multiple SMA columns
     """
-    result = pd.DataFrame(index=df.index)
-    
-    for period in periods:
-        result[f'sma_{period}'] = calculate_sma(df, period)
-    
-    return result
+    # One cumulative sum over close serves every window: each SMA is a
+    # shifted difference, so the close array is read once no matter how
+    # many periods the caller asks for
+    values = df['close'].to_numpy(dtype=np.float64)
+    csum = np.concatenate(([0.0], np.cumsum(values)))
+    columns = {f'sma_{period}': _sma_array(values, period, csum) for period in periods}
+
+    return pd.DataFrame(columns, index=df.index)
 
 
 def get_sma_signal(df: pd.DataFrame, fast_period: int = 10, slow_period: int = 20) -> str:
@@ -51,21 +76,22 @@ def get_sma_signal(df: pd.DataFrame, fast_period: int = 10, slow_period: int = 2
     Returns:
         Signal string: 'BUY', 'SELL', or 'NEUTRAL'
     """
-    if len(df) < slow_period + 1:
-        return 'NEUTRAL'
-    
-    fast_sma = calculate_sma(df, fast_period)
-    slow_sma = calculate_sma(df, slow_period)
-    
-    # Check for crossover
-    if len(fast_sma) < 2 or len(slow_sma) < 2:
+    values = df['close'].to_numpy(dtype=np.float64)
+    if len(values) < slow_period + 1:
         return 'NEUTRAL'
-    
+
+    # Only the last two windows of each SMA matter for a crossover, so
+    # take four tail-slice means instead of two full rolling passes
+    fast_curr = values[-fast_period:].mean()
+    fast_prev = values[-fast_period - 1:-1].mean()
+    slow_curr = values[-slow_period:].mean()
+    slow_prev = values[-slow_period - 1:-1].mean()
+
     # Bullish crossover: fast crosses above slow
-    if fast_sma.iloc[-2] <= slow_sma.iloc[-2] and fast_sma.iloc[-1] > slow_sma.iloc[-1]:
+    if fast_prev <= slow_prev and fast_curr > slow_curr:
         return 'BUY'
     # Bearish crossover: fast crosses below slow
-    elif fast_sma.iloc[-2] >= slow_sma.iloc[-2] and fast_sma.iloc[-1] < slow_sma.iloc[-1]:
+    elif fast_prev >= slow_prev and fast_curr < slow_curr:
         return 'SELL'
     else:
         return 'NEUTRAL'
@@ -83,11 +109,12 @@ def calculate_wma(df: pd.DataFrame, period: int = 10, column: str = 'close') ->
     Returns:
         Series with WMA values
     """
-    weights = np.arange(1, period + 1)
-    
-    def weighted_average(values):
-        if len(values) < period:
-            return np.nan
-        return np.dot(values, weights) / weights.sum()
-    
-    return df[column].rolling(window=period).apply(weighted_average, raw=True)
+    # rolling.apply runs its Python callable once per window; the same
+    # weighted average is a single compiled 1-D convolution
+    kernel = _wma_weights(period)
+
+    values = df[column].to_numpy(dtype=np.float64)
+    out = np.convolve(values, kernel[::-1], mode='full')[:len(values)]
+    out[:period - 1] = np.nan
+
+    return pd.Series(out, index=df.index)
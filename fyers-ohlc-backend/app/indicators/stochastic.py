@@ -19,46 +19,55 @@ def calculate_stochastic(df: pd.DataFrame, period: int = 14, k_smooth: int = 3,
     Returns:
         DataFrame with 'stoch_k' and 'stoch_d' columns
     """
-    result = pd.DataFrame(index=df.index)
-    
-    # Calculate raw %K
-    lowest_low = df['low'].rolling(window=period).min()
-    highest_high = df['high'].rolling(window=period).max()
-    
-    result['stoch_k_raw'] = 100 * (df['close'] - lowest_low) / (highest_high - lowest_low)
-    
-    # Smooth %K
-    result['stoch_k'] = result['stoch_k_raw'].rolling(window=k_smooth).mean()
-    
-    # Calculate %D (moving average of %K)
-    result['stoch_d'] = result['stoch_k'].rolling(window=d_smooth).mean()
-    
-    return result[['stoch_k', 'stoch_d']]
+    # Rolling bounds via pandas' compiled window kernels, everything else
+    # on raw arrays: no intermediate stoch_k_raw column or frame churn
+    lowest_low = df['low'].rolling(window=period).min().to_numpy()
+    highest_high = df['high'].rolling(window=period).max().to_numpy()
+    close = df['close'].to_numpy(dtype=np.float64)
 
+    # Flat windows make the denominator zero; a masked divide settles
+    # those slots to NaN in one pass instead of warning through 0-by-0
+    denom = highest_high - lowest_low
+    k_raw = np.divide(100.0 * (close - lowest_low), denom,
+                      out=np.full(len(close), np.nan), where=denom != 0.0)
 
-def get_stochastic_signal(df: pd.DataFrame, period: int = 14, oversold: int = 20, overbought: int = 80) -> str:
+    # Smooth %K, then %D as its moving average
+    stoch_k = pd.Series(k_raw, index=df.index).rolling(window=k_smooth).mean()
+    stoch_d = stoch_k.rolling(window=d_smooth).mean()
+
+    return pd.DataFrame({'stoch_k': stoch_k, 'stoch_d': stoch_d})
+
+
+def get_stochastic_signal(df: pd.DataFrame, period: int = 14, oversold: int = 20, overbought: int = 80, *, stoch_df: pd.DataFrame = None) -> str:
     """
     Generate trading signal based on Stochastic Oscillator.
-    
+
     Signals:
     - BUY: %K crosses above %D in oversold region
     - SELL: %K crosses below %D in overbought region
     - NEUTRAL: No clear signal
-    
+
     Args:
         df: DataFrame with stochastic data
         period: Period for calculation
         oversold: Oversold threshold (default: 20)
         overbought: Overbought threshold (default: 80)
-    
+        stoch_df: Optional precomputed calculate_stochastic output to reuse
+
     Returns:
         Signal string: 'BUY', 'SELL', or 'NEUTRAL'
     """
     if len(df) < 2:
         return 'NEUTRAL'
-    
-    stoch_data = calculate_stochastic(df, period)
-    
+
+    if stoch_df is not None:
+        stoch_data = stoch_df
+    else:
+        # Only the last two %K/%D values matter; the rolling windows
+        # behind them reach back period + smoothing bars, so computing
+        # on that tail gives the same tail values without the O(n) pass
+        stoch_data = calculate_stochastic(df.iloc[-(period + 8):], period)
+
     if stoch_data.empty or len(stoch_data) < 2:
         return 'NEUTRAL'
     
@@ -0,0 +1,206 @@
+"""
+Incremental indicator state machines for streaming bars
+Recomputing an indicator over the full history on every tick is O(n)
+per bar; these states carry the recursion forward so each new bar is a
+handful of float operations, suited to the websocket ingestion path.
+"""
+from collections import deque
+
+import numpy as np
+
+
+class EMAState:
+    """O(1) exponential moving average: ema = alpha*price + (1-alpha)*ema."""
+
+    __slots__ = ('alpha', 'value')
+
+    def __init__(self, period: int, seed: float = None):
+        self.alpha = 2.0 / (period + 1)
+        self.value = seed
+
+    def update(self, price: float) -> float:
+        if self.value is None:
+            self.value = price
+        else:
+            self.value = self.alpha * price + (1.0 - self.alpha) * self.value
+        return self.value
+
+
+class MACDState:
+    """
+    O(1) MACD: maintains the fast/slow/signal EMA recursions in step.
+
+    update() returns (macd, signal, histogram) for the new bar.
+    """
+
+    __slots__ = ('fast', 'slow', 'signal')
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        self.fast = EMAState(fast_period)
+        self.slow = EMAState(slow_period)
+        self.signal = EMAState(signal_period)
+
+    def update(self, price: float) -> tuple:
+        macd = self.fast.update(price) - self.slow.update(price)
+        signal = self.signal.update(macd)
+        return macd, signal, macd - signal
+
+
+class SupertrendState:
+    """
+    O(1) Supertrend: carries (previous supertrend, direction, close)
+    across bars, matching the recurrence in candlestick_patterns.
+
+    ATR is supplied by the caller (e.g. from its own rolling state) so
+    this class stays a pure band/direction update.
+    """
+
+    __slots__ = ('multiplier', 'st', 'direction', 'prev_close')
+
+    def __init__(self, multiplier: float = 3.0):
+        self.multiplier = multiplier
+        self.st = np.nan
+        self.direction = 1
+        self.prev_close = np.nan
+
+    def update(self, high: float, low: float, close: float, atr: float) -> tuple:
+        """Advance one bar; returns (supertrend, direction)."""
+        if self.prev_close != self.prev_close:  # first bar: no previous close yet
+            self.prev_close = close
+            return self.st, self.direction
+
+        hl2 = (high + low) / 2
+        upper = hl2 + self.multiplier * atr
+        lower = hl2 - self.multiplier * atr
+
+        st_prev = self.st
+        if self.prev_close > st_prev:
+            d = 1
+        elif self.prev_close < st_prev:
+            d = -1
+        else:
+            d = self.direction
+
+        if d < 0 and upper < st_prev:
+            st = upper
+        elif d > 0 and lower > st_prev:
+            st = lower
+        elif d < 0:
+            st = st_prev if st_prev < upper else upper
+        else:
+            st = st_prev if st_prev > lower else lower
+
+        self.st = st
+        self.direction = d
+        self.prev_close = close
+        return st, d
+
+
+class RSIState:
+    """
+    O(1) Wilder RSI, matching calculate_rsi's
+    ewm(alpha=1/period, adjust=False, min_periods=period) recursion.
+
+    update() returns the RSI for the new close, NaN until the
+    smoothing has seen a full period of changes.
+    """
+
+    __slots__ = ('alpha', 'period', 'avg_gain', 'avg_loss', 'prev_close', 'count')
+
+    def __init__(self, period: int = 14):
+        self.alpha = 1.0 / period
+        self.period = period
+        self.avg_gain = None
+        self.avg_loss = None
+        self.prev_close = None
+        self.count = 0
+
+    def update(self, close: float) -> float:
+        if self.prev_close is None:
+            # calculate_rsi treats the first bar as a zero gain/loss
+            # observation, which seeds the adjust=False recursion
+            self.prev_close = close
+            self.avg_gain = 0.0
+            self.avg_loss = 0.0
+            self.count = 1
+            return np.nan
+
+        change = close - self.prev_close
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+        self.prev_close = close
+        self.count += 1
+
+        self.avg_gain += self.alpha * (gain - self.avg_gain)
+        self.avg_loss += self.alpha * (loss - self.avg_loss)
+
+        if self.count < self.period:  # min_periods not reached yet
+            return np.nan
+        if self.avg_loss == 0.0:
+            return 100.0
+        rs = self.avg_gain / self.avg_loss
+        return 100.0 - (100.0 / (1.0 + rs))
+
+
+class ATRState:
+    """
+    O(1) Wilder ATR, matching calculate_atr's true-range series and
+    ewm(alpha=1/period, adjust=False, min_periods=period) smoothing.
+    """
+
+    __slots__ = ('alpha', 'period', 'value', 'prev_close', 'count')
+
+    def __init__(self, period: int = 14):
+        self.alpha = 1.0 / period
+        self.period = period
+        self.value = None
+        self.prev_close = None
+        self.count = 0
+
+    def update(self, high: float, low: float, close: float) -> float:
+        if self.prev_close is None:
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = close
+        self.count += 1
+
+        if self.value is None:
+            self.value = tr
+        else:
+            self.value += self.alpha * (tr - self.value)
+
+        return self.value if self.count >= self.period else np.nan
+
+
+class BollingerState:
+    """
+    Bollinger bands over a ring buffer of the last `period` closes.
+
+    update() returns (upper, middle, lower); each bar costs one small
+    window reduction instead of a rolling pass over the full history.
+    The middle band doubles as the rolling SMA of the window.
+    """
+
+    __slots__ = ('period', 'std_dev', '_window')
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0):
+        self.period = period
+        self.std_dev = std_dev
+        self._window = deque(maxlen=period)
+
+    def update(self, close: float) -> tuple:
+        self._window.append(close)
+        if len(self._window) < self.period:
+            return np.nan, np.nan, np.nan
+        arr = np.asarray(self._window)
+        middle = arr.mean()
+        offset = arr.std(ddof=1) * self.std_dev
+        return middle + offset, middle, middle - offset
+
+    @property
+    def mean(self) -> float:
+        """Rolling SMA of the window (NaN until the window fills)."""
+        if len(self._window) < self.period:
+            return np.nan
+        return sum(self._window) / self.period
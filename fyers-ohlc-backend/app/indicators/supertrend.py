@@ -31,48 +31,59 @@ def calculate_supertrend(df: pd.DataFrame, atr_period: int = 7, multiplier: floa
     upper_band = hl_avg + (multiplier * atr)
     lower_band = hl_avg - (multiplier * atr)
     
-    # Initialize arrays
-    supertrend = pd.Series(index=df.index, dtype='float64')
-    direction = pd.Series(index=df.index, dtype='int64')
-    
-    # Initialize first values
-    supertrend.iloc[0] = upper_band.iloc[0]
-    direction.iloc[0] = 1
-    
-    # Calculate Supertrend
-    for i in range(1, len(df)):
+    # Run the recurrence on raw arrays; every .iloc in the old loop paid
+    # pandas scalar-indexing machinery per element
+    st, dirn = _supertrend_core(
+        close.to_numpy(dtype=np.float64),
+        upper_band.to_numpy(dtype=np.float64),
+        lower_band.to_numpy(dtype=np.float64),
+    )
+
+    result = pd.DataFrame({
+        'supertrend': st,
+        'direction': dirn
+    }, index=df.index)
+
+    return result
+
+
+def _supertrend_core(close: np.ndarray, upper: np.ndarray, lower: np.ndarray) -> tuple:
+    """
+    Supertrend band/direction recurrence over float64 arrays.
+
+    Band carry-over and NaN warm-up behave exactly as the previous
+    Series-mutating loop (comparisons with NaN are false, so bands pass
+    through unchanged until ATR is warm).
+    """
+    n = len(close)
+    st = np.full(n, np.nan)
+    dirn = np.ones(n, dtype=np.int64)
+    if n:
+        st[0] = upper[0]
+
+    for i in range(1, n):
+        ub_prev = upper[i - 1]
+        lb_prev = lower[i - 1]
+
         # Update upper and lower bands
-        if close.iloc[i-1] > upper_band.iloc[i-1]:
-            upper_band.iloc[i] = max(upper_band.iloc[i], upper_band.iloc[i-1])
-        else:
-            upper_band.iloc[i] = upper_band.iloc[i]
-        
-        if close.iloc[i-1] < lower_band.iloc[i-1]:
-            lower_band.iloc[i] = min(lower_band.iloc[i], lower_band.iloc[i-1])
-        else:
-            lower_band.iloc[i] = lower_band.iloc[i]
-        
+        if close[i - 1] > ub_prev and ub_prev > upper[i]:
+            upper[i] = ub_prev
+        if close[i - 1] < lb_prev and lb_prev < lower[i]:
+            lower[i] = lb_prev
+
         # Determine direction and supertrend
-        if close.iloc[i] <= lower_band.iloc[i-1]:
-            direction.iloc[i] = -1  # Bearish
-            supertrend.iloc[i] = lower_band.iloc[i]
-        elif close.iloc[i] >= upper_band.iloc[i-1]:
-            direction.iloc[i] = 1  # Bullish
-            supertrend.iloc[i] = upper_band.iloc[i]
+        if close[i] <= lb_prev:
+            dirn[i] = -1  # Bearish
+            st[i] = lower[i]
+        elif close[i] >= ub_prev:
+            dirn[i] = 1  # Bullish
+            st[i] = upper[i]
         else:
             # Continue previous trend
-            direction.iloc[i] = direction.iloc[i-1]
-            if direction.iloc[i] == 1:
-                supertrend.iloc[i] = lower_band.iloc[i]
-            else:
-                supertrend.iloc[i] = upper_band.iloc[i]
-    
-    result = pd.DataFrame({
-        'supertrend': supertrend,
-        'direction': direction
-    })
-    
-    return result
+            dirn[i] = dirn[i - 1]
+            st[i] = lower[i] if dirn[i] == 1 else upper[i]
+
+    return st, dirn
 
 
 def get_supertrend_signal(df: pd.DataFrame, st: pd.DataFrame) -> str:
@@ -89,11 +100,11 @@ def get_supertrend_signal(df: pd.DataFrame, st: pd.DataFrame) -> str:
     if len(df) == 0 or len(st) == 0:
         return 'INSUFFICIENT_DATA'
     
-    current_price = df['close'].iloc[-1]
-    current_supertrend = st['supertrend'].iloc[-1]
-    current_direction = st['direction'].iloc[-1]
-    
-    if pd.isna(current_price) or pd.isna(current_supertrend):
+    current_price = float(df['close'].iat[-1])
+    current_supertrend = float(st['supertrend'].iat[-1])
+    current_direction = st['direction'].iat[-1]
+
+    if current_price != current_price or current_supertrend != current_supertrend:  # NaN checks
         return 'INSUFFICIENT_DATA'
     
     if current_direction == 1:
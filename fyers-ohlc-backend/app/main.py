@@ -1,6 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from app.routes import (
     health, auth, ohlc, market, 
     websocket, strategies, signals, candlestick, strategy, trend_analysis,
@@ -13,7 +13,10 @@ app = FastAPI(
     description="API for fetching and caching OHLC (Open, High, Low, Close) stock market data from Fyers",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # orjson serializes the float-heavy indicator payloads several times
+    # faster than the stdlib json encoder
+    default_response_class=ORJSONResponse
 )
 
 # CORS configuration
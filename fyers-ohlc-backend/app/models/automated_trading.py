@@ -2,46 +2,52 @@
 Database models for Automated Trading History
 """
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any, ClassVar, Literal, Mapping, Tuple
+from pydantic import BaseModel, ConfigDict, computed_field, field_serializer
 
 
 class AutoTradingSession(BaseModel):
     """Model for storing automated trading session data"""
+    # frozen drops the per-instance mutation machinery and lets
+    # instances be shared safely; extra="forbid" skips the extras-dict
+    # allocation pydantic otherwise carries per instance.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    __field_names__: ClassVar[Tuple[str, ...]] = ()
+
     session_id: str
     symbols: List[str]
     strategies: List[str]
     start_date: str
     end_date: Optional[str] = None
-    mode: str  # HISTORICAL or LIVE
+    mode: Literal["HISTORICAL", "LIVE"]
     initial_capital: float
     stop_loss_percent: float
     profit_target_percent: float
-    status: str  # RUNNING, COMPLETED, STOPPED, ERROR
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    status: Literal["RUNNING", "COMPLETED", "STOPPED", "ERROR"]
+    created_at: datetime  # caller supplies one clock read for the batch
     completed_at: Optional[datetime] = None
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "session_id": "session_1234567890",
-                "symbols": ["NSE:RELIANCE-EQ"],
-                "strategies": ["RSI", "MACD"],
-                "start_date": "2025-01-01",
-                "end_date": "2025-01-31",
-                "mode": "HISTORICAL",
-                "initial_capital": 100000.0,
-                "stop_loss_percent": 2.0,
-                "profit_target_percent": 5.0,
-                "status": "COMPLETED",
-                "created_at": "2025-01-01T10:00:00",
-                "completed_at": "2025-01-01T15:00:00"
-            }
-        }
+
+    @classmethod
+    def from_trusted(cls, **kwargs) -> "AutoTradingSession":
+        """Build without validation. Only use for data guaranteed valid
+        (engine computation or our own DB writes), never API input."""
+        return cls.model_construct(**kwargs)
+
+    @classmethod
+    def from_row(cls, row: Mapping) -> "AutoTradingSession":
+        """Rehydrate a stored session row (e.g. a Mongo document) without
+        re-validating data we validated when it was written."""
+        return cls.model_construct(**dict(row))
+
 
 
 class AutoTradingResult(BaseModel):
     """Model for storing automated trading results with proper P&L separation"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    __field_names__: ClassVar[Tuple[str, ...]] = ()
+
     session_id: str
     
     # Configuration (input parameters)
@@ -49,7 +55,7 @@ class AutoTradingResult(BaseModel):
     strategies: List[str]
     start_date: str
     end_date: Optional[str] = None
-    mode: str  # HISTORICAL or LIVE
+    mode: Literal["HISTORICAL", "LIVE"]
     stop_loss_percent: float
     profit_target_percent: float
     initial_capital: float
@@ -57,9 +63,10 @@ class AutoTradingResult(BaseModel):
     position_size_percent: float
     timeframe: str
     
-    # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    completed_at: datetime = Field(default_factory=datetime.utcnow)
+    # Timestamps (required: the route passes one clock read rather than
+    # paying a default_factory utcnow() call per field per construction)
+    created_at: datetime
+    completed_at: datetime
     
     # Capital tracking
     current_capital: float  # Cash available (reference only)
@@ -73,6 +80,10 @@ class AutoTradingResult(BaseModel):
     total_pnl: float  # DERIVED: final_value - initial_capital (NOT independent calculation)
     
     # Returns calculation (MUST be derived from final_value)
+    # NOTE: derived metrics here and below stay bare floats on purpose —
+    # they come out of our own arithmetic, and constraint-free fields
+    # take pydantic's fast path. Range checks belong on the request
+    # model at the API boundary, not on every result construction.
     returns_percent: float  # DERIVED: (final_value - initial_capital) / initial_capital * 100
     
     # ACCOUNTING IDENTITY (ENFORCED):
@@ -106,56 +117,53 @@ class AutoTradingResult(BaseModel):
     # Daily tracking
     daily_pnl: Dict[str, float]
     equity_curve: List[Dict[str, Any]]  # Daily portfolio value tracking
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "session_id": "session_1234567890",
-                "initial_capital": 100000.0,
-                "current_capital": 95000.0,
-                "invested_capital": 5000.0,
-                "final_value": 102200.0,
-                "realized_pnl": 2000.0,
-                "unrealized_pnl": 500.0,
-                "total_charges": 300.0,
-                "total_pnl": 2200.0,
-                "returns_percent": 2.2,
-                "total_trades": 15,
-                "winning_trades": 9,
-                "losing_trades": 6,
-                "win_rate": 60.0,
-                "avg_win": 350.0,
-                "avg_loss": -150.0,
-                "profit_factor": 2.33,
-                "open_positions_count": 2,
-                "closed_positions_count": 15,
-                "total_brokerage": 300.0,
-                "total_signals_generated": 250,
-                "signal_breakdown": {"RSI": {"BUY": 50, "SELL": 45, "total": 95}},
-                "executed_trades": [],
-                "daily_pnl": {"2025-01-01": 500.0},
-                "equity_curve": [],
-                "timestamp": "2025-01-01T15:00:00"
-            }
-        }
+
+    @classmethod
+    def from_trusted(cls, **kwargs) -> "AutoTradingResult":
+        """Build without validation. Only use for data guaranteed valid
+        (engine computation or our own DB writes), never API input."""
+        return cls.model_construct(**kwargs)
+
+    def with_updated(self, **changes) -> "AutoTradingResult":
+        """Derived copy with some fields replaced; model_copy skips
+        re-validating the already-validated data."""
+        return self.model_copy(update=changes)
+
+    def as_mapping(self) -> Dict[str, Any]:
+        """Plain dict of the fields via direct attribute reads.
+
+        Cheaper than model_dump() for DB writes: no serializer
+        machinery, and the field-name tuple is memoized on the class
+        instead of re-walking model_fields per call."""
+        return {name: getattr(self, name) for name in self.__field_names__}
+
+    def append_equity_point(self, point: Dict[str, Any]) -> None:
+        """Append one equity-curve entry in place rather than rebuilding
+        the whole model around a new list."""
+        self.equity_curve.append(point)
+
 
 
 class AutoTradingTrade(BaseModel):
     """Model for completed trades (BUY→SELL round trips only)"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    __field_names__: ClassVar[Tuple[str, ...]] = ()
+
     session_id: str
     symbol: str
     
     # Entry details
-    entry_side: str  # Always "BUY" for long trades
+    entry_side: Literal["BUY", "SELL"]  # Always "BUY" for long trades
     entry_price: float
     entry_timestamp: datetime
     quantity: int
     
     # Exit details (REQUIRED - every trade must have an exit)
-    exit_side: str  # "SELL" for long, "BUY" for short
+    exit_side: Literal["BUY", "SELL"]  # "SELL" for long, "BUY" for short
     exit_price: float
     exit_timestamp: datetime
-    exit_reason: str  # "TARGET", "STOP_LOSS", "AUTO_EXIT", "SIGNAL_EXIT"
+    exit_reason: Literal["TARGET", "STOP_LOSS", "AUTO_EXIT", "SIGNAL_EXIT"]
     
     # Trade parameters
     strategy: str  # Strategy that generated the signal
@@ -167,28 +175,28 @@ class AutoTradingTrade(BaseModel):
     brokerage: float  # Total brokerage for this trade
     net_pnl: float  # After brokerage (this is the realized P&L)
     
-    # Trade metadata
-    holding_period_minutes: int  # Time between entry and exit
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "session_id": "session_1234567890",
-                "symbol": "NSE:RELIANCE-EQ",
-                "entry_side": "BUY",
-                "entry_price": 1500.0,
-                "entry_timestamp": "2025-01-01T10:30:00",
-                "quantity": 10,
-                "exit_side": "SELL",
-                "exit_price": 1525.0,
-                "exit_timestamp": "2025-01-01T14:00:00",
-                "exit_reason": "TARGET",
-                "strategy": "RSI",
-                "stop_loss": 1470.0,
-                "target": 1575.0,
-                "gross_pnl": 250.0,
-                "brokerage": 40.0,
-                "net_pnl": 210.0,
-                "holding_period_minutes": 210
-            }
-        }
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def holding_period_minutes(self) -> int:
+        """Time between entry and exit, derived so it can never drift
+        from the timestamps it summarizes."""
+        return int((self.exit_timestamp - self.entry_timestamp).total_seconds() // 60)
+
+    @field_serializer('entry_timestamp', 'exit_timestamp')
+    def _serialize_timestamp(self, value: datetime) -> int:
+        """Serialize as epoch milliseconds: one small int per field
+        instead of a ~20-byte ISO string, for payloads full of trades."""
+        return int(value.timestamp() * 1000)
+
+    @classmethod
+    def from_trusted(cls, **kwargs) -> "AutoTradingTrade":
+        """Build without validation. Only use for data guaranteed valid
+        (engine computation or our own DB writes), never API input."""
+        return cls.model_construct(**kwargs)
+
+
+# Memoized once at import: serialization helpers iterate these tuples
+# instead of allocating a model_fields keys view per call.
+AutoTradingSession.__field_names__ = tuple(AutoTradingSession.model_fields.keys())
+AutoTradingResult.__field_names__ = tuple(AutoTradingResult.model_fields.keys())
+AutoTradingTrade.__field_names__ = tuple(AutoTradingTrade.model_fields.keys())
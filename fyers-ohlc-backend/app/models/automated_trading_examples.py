@@ -0,0 +1,73 @@
+"""
+Example payloads for the automated trading models.
+
+Kept out of the model classes themselves: json_schema_extra blocks are
+instantiated at class definition and folded into each model's core
+schema, paying import-time and schema-build cost for dicts that only
+documentation ever reads. Import this module from docs tooling or a
+route's openapi_extra when an example is actually needed.
+"""
+
+AUTO_TRADING_SESSION_EXAMPLE = {
+    "session_id": "session_1234567890",
+    "symbols": ["NSE:RELIANCE-EQ"],
+    "strategies": ["RSI", "MACD"],
+    "start_date": "2025-01-01",
+    "end_date": "2025-01-31",
+    "mode": "HISTORICAL",
+    "initial_capital": 100000.0,
+    "stop_loss_percent": 2.0,
+    "profit_target_percent": 5.0,
+    "status": "COMPLETED",
+    "created_at": "2025-01-01T10:00:00",
+    "completed_at": "2025-01-01T15:00:00"
+}
+
+AUTO_TRADING_RESULT_EXAMPLE = {
+    "session_id": "session_1234567890",
+    "initial_capital": 100000.0,
+    "current_capital": 95000.0,
+    "invested_capital": 5000.0,
+    "final_value": 102200.0,
+    "realized_pnl": 2000.0,
+    "unrealized_pnl": 500.0,
+    "total_charges": 300.0,
+    "total_pnl": 2200.0,
+    "returns_percent": 2.2,
+    "total_trades": 15,
+    "winning_trades": 9,
+    "losing_trades": 6,
+    "win_rate": 60.0,
+    "avg_win": 350.0,
+    "avg_loss": -150.0,
+    "profit_factor": 2.33,
+    "open_positions_count": 2,
+    "closed_positions_count": 15,
+    "total_brokerage": 300.0,
+    "total_signals_generated": 250,
+    "signal_breakdown": {"RSI": {"BUY": 50, "SELL": 45, "total": 95}},
+    "executed_trades": [],
+    "daily_pnl": {"2025-01-01": 500.0},
+    "equity_curve": [],
+    "timestamp": "2025-01-01T15:00:00"
+}
+
+AUTO_TRADING_TRADE_EXAMPLE = {
+    "session_id": "session_1234567890",
+    "symbol": "NSE:RELIANCE-EQ",
+    "entry_side": "BUY",
+    "entry_price": 1500.0,
+    "entry_timestamp": "2025-01-01T10:30:00",
+    "quantity": 10,
+    "exit_side": "SELL",
+    "exit_price": 1525.0,
+    "exit_timestamp": "2025-01-01T14:00:00",
+    "exit_reason": "TARGET",
+    "strategy": "RSI",
+    "stop_loss": 1470.0,
+    "target": 1575.0,
+    "gross_pnl": 250.0,
+    "brokerage": 40.0,
+    "net_pnl": 210.0,
+    "holding_period_minutes": 210
+}
@@ -2,12 +2,11 @@
 Paper Trading System
 
 A complete simulation environment for testing trading strategies without real money.
-"""
 
-from .engine import PaperTradingEngine
-from .position import Position, PositionSide
-from .order import Order, OrderType, OrderStatus
-from .portfolio import Portfolio
+Submodules are loaded lazily (PEP 562): importing the package is cheap,
+and workers that never paper-trade skip the engine's dependencies.
+"""
+import importlib
 
 __all__ = [
     'PaperTradingEngine',
@@ -18,3 +17,27 @@ __all__ = [
     'OrderStatus',
     'Portfolio',
 ]
+
+# exported name -> defining submodule
+_lazy = {
+    'PaperTradingEngine': 'engine',
+    'Position': 'position',
+    'PositionSide': 'position',
+    'Order': 'order',
+    'OrderType': 'order',
+    'OrderStatus': 'order',
+    'Portfolio': 'portfolio',
+}
+
+
+def __getattr__(name):
+    if name in _lazy:
+        module = importlib.import_module(f'.{_lazy[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -9,11 +9,15 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, date, timedelta
 from dataclasses import dataclass
 import asyncio
+import math
 from enum import Enum
+import numpy as np
 import pandas as pd
 
 from .engine import PaperTradingEngine
 from .order import OrderSide
+from .signal_buffer import SignalBuffer
+from .trades_table import TradesTable
 from app.services.fyers import get_fyers_client, normalize_symbol
 from app.schemas.trading import TradingSignal
 from app.indicators.rsi import calculate_rsi
@@ -23,6 +27,7 @@ from app.indicators.bollinger import calculate_bollinger_bands
 from app.indicators.adx import calculate_adx
 from app.indicators.atr import calculate_atr
 from app.indicators.renko import calculate_renko, get_renko_signal
+from app.indicators.streaming import ATRState, BollingerState, MACDState, RSIState
 
 
 class TradingMode(Enum):
@@ -74,6 +79,39 @@ class StrategySignal:
         self.metadata = metadata or {}
 
 
+def _count_consecutive(trend: np.ndarray) -> tuple:
+    """Trailing run lengths of up (1) and down (-1) bricks.
+
+    An up brick resets the down counter and vice versa, while other
+    values leave both counters untouched — so the result is the number
+    of 1s after the last -1 and of -1s after the last 1, from two
+    vectorized compares instead of a Python loop per brick.
+    """
+    ups = np.flatnonzero(trend == 1)
+    downs = np.flatnonzero(trend == -1)
+    last_up = ups[-1] if ups.size else -1
+    last_down = downs[-1] if downs.size else -1
+    return int((ups > last_down).sum()), int((downs > last_up).sum())
+
+
+def _log_strategy_error(strategy_name: str, symbol: str, exc: Exception) -> None:
+    """Uniform error line for a failed strategy evaluation."""
+    print(f"{strategy_name} strategy error for {symbol}: {exc}")
+
+
+def _derive_identity(initial: float, realized: float, unrealized: float,
+                     charges: float) -> tuple:
+    """Fused accounting identity: (final_value, total_pnl, returns_percent).
+
+    One pass keeps the three derived numbers consistent by construction
+    instead of re-deriving each from initial_capital at separate sites.
+    """
+    final_value = initial + realized + unrealized - charges
+    total_pnl = final_value - initial
+    returns_percent = (total_pnl / initial) * 100 if initial else 0.0
+    return final_value, total_pnl, returns_percent
+
+
 class AutomatedTradingEngine:
     """
     Automated Trading Engine
@@ -106,312 +144,404 @@ class AutomatedTradingEngine:
             self.fyers = None
         
         # Track signals and executed trades
-        self.all_signals: List[StrategySignal] = []
+        # Packed column store of every generated signal; consumers only
+        # count the history, so the transient StrategySignal objects are
+        # not retained
+        self.all_signals = SignalBuffer()
         self.executed_trades: List[Dict[str, Any]] = []
-        self.daily_pnl: Dict[date, float] = {}
+        # Daily P&L as a float64 array indexed by day offset from
+        # config.start_date: O(1) writes without date-string hashing,
+        # NaN marks days with no entry. The dict shape only exists in
+        # the results payload.
+        n_days = (config.end_date - config.start_date).days + 1
+        self._daily_pnl = np.full(max(n_days, 1), np.nan)
+        # Columnar store of completed round trips, synced lazily from
+        # portfolio.closed_positions in get_results
+        self._trades_table = TradesTable()
+        # Signal counts per strategy, maintained incrementally as
+        # signals are generated instead of rebuilt from all_signals on
+        # every get_results call
+        self._signal_breakdown: Dict[str, Dict[str, int]] = {}
         
         # Active positions with stop loss and target tracking
         self.position_metadata: Dict[str, Dict[str, Any]] = {}
-        
-    def run_rsi_strategy(self, symbol: str, df: pd.DataFrame) -> Optional[StrategySignal]:
+
+        # Incremental indicator states per symbol for LIVE mode: each
+        # new candle advances the recursions in O(1) instead of
+        # recomputing every indicator over the fetched window
+        self._live_states: Dict[str, Dict[str, Any]] = {}
+
+        # Full-history indicator arrays per symbol, primed once before a
+        # historical backtest. Every indicator here is causal (value at
+        # bar i depends only on bars 0..i), so reading index i from the
+        # full-series arrays equals recomputing over the prefix — which
+        # turns the per-bar strategy pass from O(N) into O(1).
+        self._indicator_cache: Dict[str, Dict[str, Any]] = {}
+        
+    # Strategies whose live evaluation can come from O(1) streaming
+    # states; the rest recompute on the fetched window
+    _STATE_BACKED = frozenset({"RSI", "MACD", "ATR", "BOLLINGER"})
+
+    def run_rsi_strategy(self, symbol: str, df: pd.DataFrame,
+                     last_price=None, timestamp: datetime = None) -> Optional[StrategySignal]:
         """Run RSI strategy and generate signal"""
+        if df is None or len(df) < 15:
+            return None
+        
         try:
-            if df is None or len(df) < 15:
-                return None
-            
             rsi_values = calculate_rsi(df, period=14)
             
-            if len(rsi_values) < 2 or pd.isna(rsi_values.iloc[-1]):
+            if len(rsi_values) < 2 or math.isnan(float(rsi_values.iloc[-1])):
                 return None
             
-            current_rsi = rsi_values.iloc[-1]
-            prev_rsi = rsi_values.iloc[-2]
-            current_price = df['close'].iloc[-1]
-            timestamp = datetime.fromtimestamp(df['timestamp'].iloc[-1])
-            
-            # RSI oversold (< 30) -> BUY signal
-            if current_rsi < 30 and prev_rsi >= 30:
-                return StrategySignal(
-                    strategy_name="RSI",
-                    symbol=symbol,
-                    signal="BUY",
-                    price=current_price,
-                    timestamp=timestamp,
-                    confidence=min(1.0, (30 - current_rsi) / 30),
-                    metadata={"rsi": current_rsi}
-                )
-            
-            # RSI overbought (> 70) -> SELL signal
-            elif current_rsi > 70 and prev_rsi <= 70:
-                return StrategySignal(
-                    strategy_name="RSI",
-                    symbol=symbol,
-                    signal="SELL",
-                    price=current_price,
-                    timestamp=timestamp,
-                    confidence=min(1.0, (current_rsi - 70) / 30),
-                    metadata={"rsi": current_rsi}
-                )
+            if last_price is None:
+                last_price = df['close'].iloc[-1]
+            if timestamp is None:
+                timestamp = datetime.fromtimestamp(df['timestamp'].iloc[-1])
+            return self._rsi_decision(
+                symbol, rsi_values.iloc[-1], rsi_values.iloc[-2],
+                last_price, timestamp)
                 
         except Exception as e:
-            print(f"RSI strategy error for {symbol}: {e}")
+            _log_strategy_error("RSI", symbol, e)
+        
+        return None
+
+    def _rsi_decision(self, symbol: str, current_rsi, prev_rsi, current_price,
+                      timestamp: datetime) -> Optional[StrategySignal]:
+        """RSI signal rule on already-extracted scalars."""
+        # RSI oversold (< 30) -> BUY signal
+        if current_rsi < 30 and prev_rsi >= 30:
+            return StrategySignal(
+                strategy_name="RSI",
+                symbol=symbol,
+                signal="BUY",
+                price=current_price,
+                timestamp=timestamp,
+                confidence=min(1.0, (30 - current_rsi) / 30),
+                metadata={"rsi": current_rsi}
+            )
+        
+        # RSI overbought (> 70) -> SELL signal
+        elif current_rsi > 70 and prev_rsi <= 70:
+            return StrategySignal(
+                strategy_name="RSI",
+                symbol=symbol,
+                signal="SELL",
+                price=current_price,
+                timestamp=timestamp,
+                confidence=min(1.0, (current_rsi - 70) / 30),
+                metadata={"rsi": current_rsi}
+            )
         
         return None
     
-    def run_macd_strategy(self, symbol: str, df: pd.DataFrame) -> Optional[StrategySignal]:
+    def run_macd_strategy(self, symbol: str, df: pd.DataFrame,
+                      last_price=None, timestamp: datetime = None) -> Optional[StrategySignal]:
         """Run MACD strategy and generate signal"""
+        if df is None or len(df) < 26:
+            return None
+        
         try:
-            if df is None or len(df) < 26:
-                return None
-            
             macd_result = calculate_macd(df)
             
-            if len(macd_result['macd']) < 2 or pd.isna(macd_result['macd'].iloc[-1]):
+            if len(macd_result['macd']) < 2 or math.isnan(float(macd_result['macd'].iloc[-1])):
                 return None
             
-            current_macd = macd_result['macd'].iloc[-1]
-            current_signal = macd_result['signal'].iloc[-1]
-            prev_macd = macd_result['macd'].iloc[-2]
-            prev_signal = macd_result['signal'].iloc[-2]
-            current_price = df['close'].iloc[-1]
-            timestamp = datetime.fromtimestamp(df['timestamp'].iloc[-1])
-            
-            # MACD crosses above signal -> BUY
-            if current_macd > current_signal and prev_macd <= prev_signal:
-                return StrategySignal(
-                    strategy_name="MACD",
-                    symbol=symbol,
-                    signal="BUY",
-                    price=current_price,
-                    timestamp=timestamp,
-                    confidence=0.7,
-                    metadata={"macd": current_macd, "signal": current_signal}
-                )
-            
-            # MACD crosses below signal -> SELL
-            elif current_macd < current_signal and prev_macd >= prev_signal:
-                return StrategySignal(
-                    strategy_name="MACD",
-                    symbol=symbol,
-                    signal="SELL",
-                    price=current_price,
-                    timestamp=timestamp,
-                    confidence=0.7,
-                    metadata={"macd": current_macd, "signal": current_signal}
-                )
+            if last_price is None:
+                last_price = df['close'].iloc[-1]
+            if timestamp is None:
+                timestamp = datetime.fromtimestamp(df['timestamp'].iloc[-1])
+            return self._macd_decision(
+                symbol,
+                macd_result['macd'].iloc[-1], macd_result['signal'].iloc[-1],
+                macd_result['macd'].iloc[-2], macd_result['signal'].iloc[-2],
+                last_price, timestamp)
                 
         except Exception as e:
-            print(f"MACD strategy error for {symbol}: {e}")
+            _log_strategy_error("MACD", symbol, e)
+        
+        return None
+
+    def _macd_decision(self, symbol: str, current_macd, current_signal,
+                       prev_macd, prev_signal, current_price,
+                       timestamp: datetime) -> Optional[StrategySignal]:
+        """MACD cross rule on already-extracted scalars."""
+        # MACD crosses above signal -> BUY
+        if current_macd > current_signal and prev_macd <= prev_signal:
+            return StrategySignal(
+                strategy_name="MACD",
+                symbol=symbol,
+                signal="BUY",
+                price=current_price,
+                timestamp=timestamp,
+                confidence=0.7,
+                metadata={"macd": current_macd, "signal": current_signal}
+            )
+        
+        # MACD crosses below signal -> SELL
+        elif current_macd < current_signal and prev_macd >= prev_signal:
+            return StrategySignal(
+                strategy_name="MACD",
+                symbol=symbol,
+                signal="SELL",
+                price=current_price,
+                timestamp=timestamp,
+                confidence=0.7,
+                metadata={"macd": current_macd, "signal": current_signal}
+            )
         
         return None
     
-    def run_supertrend_strategy(self, symbol: str, df: pd.DataFrame) -> Optional[StrategySignal]:
+    def run_supertrend_strategy(self, symbol: str, df: pd.DataFrame,
+                            last_price=None, timestamp: datetime = None) -> Optional[StrategySignal]:
         """Run Supertrend strategy and generate signal"""
+        if df is None or len(df) < 10:
+            return None
+        
         try:
-            if df is None or len(df) < 10:
-                return None
-            
             st_result = calculate_supertrend(df)
             
             if len(st_result['direction']) < 2:
                 return None
             
-            current_trend = st_result['direction'].iloc[-1]
-            prev_trend = st_result['direction'].iloc[-2]
-            current_price = df['close'].iloc[-1]
-            timestamp = datetime.fromtimestamp(df['timestamp'].iloc[-1])
-            
-            # Trend changed to bullish -> BUY
-            if current_trend == 1 and prev_trend == -1:
-                return StrategySignal(
-                    strategy_name="SUPERTREND",
-                    symbol=symbol,
-                    signal="BUY",
-                    price=current_price,
-                    timestamp=timestamp,
-                    confidence=0.8,
-                    metadata={"supertrend": st_result['supertrend'].iloc[-1]}
-                )
-            
-            # Trend changed to bearish -> SELL
-            elif current_trend == -1 and prev_trend == 1:
-                return StrategySignal(
-                    strategy_name="SUPERTREND",
-                    symbol=symbol,
-                    signal="SELL",
-                    price=current_price,
-                    timestamp=timestamp,
-                    confidence=0.8,
-                    metadata={"supertrend": st_result['supertrend'].iloc[-1]}
-                )
+            if last_price is None:
+                last_price = df['close'].iloc[-1]
+            if timestamp is None:
+                timestamp = datetime.fromtimestamp(df['timestamp'].iloc[-1])
+            return self._supertrend_decision(
+                symbol,
+                st_result['direction'].iloc[-1], st_result['direction'].iloc[-2],
+                st_result['supertrend'].iloc[-1],
+                last_price, timestamp)
                 
         except Exception as e:
-            print(f"Supertrend strategy error for {symbol}: {e}")
+            _log_strategy_error("SUPERTREND", symbol, e)
+        
+        return None
+
+    def _supertrend_decision(self, symbol: str, current_trend, prev_trend,
+                             supertrend_value, current_price,
+                             timestamp: datetime) -> Optional[StrategySignal]:
+        """Supertrend direction-flip rule on already-extracted scalars."""
+        # Trend changed to bullish -> BUY
+        if current_trend == 1 and prev_trend == -1:
+            return StrategySignal(
+                strategy_name="SUPERTREND",
+                symbol=symbol,
+                signal="BUY",
+                price=current_price,
+                timestamp=timestamp,
+                confidence=0.8,
+                metadata={"supertrend": supertrend_value}
+            )
+        
+        # Trend changed to bearish -> SELL
+        elif current_trend == -1 and prev_trend == 1:
+            return StrategySignal(
+                strategy_name="SUPERTREND",
+                symbol=symbol,
+                signal="SELL",
+                price=current_price,
+                timestamp=timestamp,
+                confidence=0.8,
+                metadata={"supertrend": supertrend_value}
+            )
         
         return None
     
-    def run_bollinger_strategy(self, symbol: str, df: pd.DataFrame) -> Optional[StrategySignal]:
+    def run_bollinger_strategy(self, symbol: str, df: pd.DataFrame,
+                           last_price=None, timestamp: datetime = None) -> Optional[StrategySignal]:
         """Run Bollinger Bands strategy and generate signal"""
+        if df is None or len(df) < 20:
+            return None
+        
         try:
-            if df is None or len(df) < 20:
-                return None
-            
             bb_result = calculate_bollinger_bands(df)
             
-            if len(bb_result['middle_band']) < 1 or pd.isna(bb_result['middle_band'].iloc[-1]):
+            if len(bb_result['middle_band']) < 1 or math.isnan(float(bb_result['middle_band'].iloc[-1])):
                 return None
             
-            current_price = df['close'].iloc[-1]
-            upper_band = bb_result['upper_band'].iloc[-1]
-            lower_band = bb_result['lower_band'].iloc[-1]
-            timestamp = datetime.fromtimestamp(df['timestamp'].iloc[-1])
+            if last_price is None:
+                last_price = df['close'].iloc[-1]
+            if timestamp is None:
+                timestamp = datetime.fromtimestamp(df['timestamp'].iloc[-1])
+            return self._bollinger_decision(
+                symbol,
+                bb_result['upper_band'].iloc[-1], bb_result['lower_band'].iloc[-1],
+                last_price, timestamp)
+                
+        except Exception as e:
+            _log_strategy_error("BOLLINGER", symbol, e)
+        
+        return None
+
+    def _bollinger_decision(self, symbol: str, upper_band, lower_band,
+                            current_price,
+                            timestamp: datetime) -> Optional[StrategySignal]:
+        """Bollinger band-touch rule on already-extracted scalars."""
+        # Price touches lower band -> BUY
+        if current_price <= lower_band:
+            return StrategySignal(
+                strategy_name="BOLLINGER",
+                symbol=symbol,
+                signal="BUY",
+                price=current_price,
+                timestamp=timestamp,
+                confidence=0.6,
+                metadata={"upper_band": upper_band, "lower_band": lower_band}
+            )
+        
+        # Price touches upper band -> SELL
+        elif current_price >= upper_band:
+            return StrategySignal(
+                strategy_name="BOLLINGER",
+                symbol=symbol,
+                signal="SELL",
+                price=current_price,
+                timestamp=timestamp,
+                confidence=0.6,
+                metadata={"upper_band": upper_band, "lower_band": lower_band}
+            )
+        
+        return None
+    
+    def run_adx_strategy(self, symbol: str, df: pd.DataFrame, sma_20=None,
+                         last_price=None, timestamp: datetime = None) -> Optional[StrategySignal]:
+        """Run ADX strategy and generate signal"""
+        if df is None or len(df) < 28:
+            return None
+        
+        try:
+            adx_result = calculate_adx(df)
+            
+            if math.isnan(float(adx_result.iloc[-1])):
+                return None
             
-            # Price touches lower band -> BUY
-            if current_price <= lower_band:
+            if sma_20 is None:
+                sma_20 = df['close'].rolling(window=20).mean().iloc[-1]
+            if last_price is None:
+                last_price = df['close'].iloc[-1]
+            if timestamp is None:
+                timestamp = datetime.fromtimestamp(df['timestamp'].iloc[-1])
+            return self._adx_decision(
+                symbol, adx_result.iloc[-1], sma_20,
+                last_price, timestamp)
+                
+        except Exception as e:
+            _log_strategy_error("ADX", symbol, e)
+        
+        return None
+
+    def _adx_decision(self, symbol: str, current_adx, sma_20, current_price,
+                      timestamp: datetime) -> Optional[StrategySignal]:
+        """ADX trend-strength rule on already-extracted scalars."""
+        # Strong trend (ADX > 25) - direction from close vs 20-period SMA
+        if current_adx > 25:
+            if current_price > sma_20:
+                confidence = min(1.0, (current_adx - 25) / 50)
                 return StrategySignal(
-                    strategy_name="BOLLINGER",
+                    strategy_name="ADX",
                     symbol=symbol,
                     signal="BUY",
                     price=current_price,
                     timestamp=timestamp,
-                    confidence=0.6,
-                    metadata={"upper_band": upper_band, "lower_band": lower_band}
+                    confidence=confidence,
+                    metadata={"adx": current_adx, "trend": "strong_uptrend"}
                 )
-            
-            # Price touches upper band -> SELL
-            elif current_price >= upper_band:
+            elif current_price < sma_20:
+                confidence = min(1.0, (current_adx - 25) / 50)
                 return StrategySignal(
-                    strategy_name="BOLLINGER",
+                    strategy_name="ADX",
                     symbol=symbol,
                     signal="SELL",
                     price=current_price,
                     timestamp=timestamp,
-                    confidence=0.6,
-                    metadata={"upper_band": upper_band, "lower_band": lower_band}
+                    confidence=confidence,
+                    metadata={"adx": current_adx, "trend": "strong_downtrend"}
                 )
-                
-        except Exception as e:
-            print(f"Bollinger strategy error for {symbol}: {e}")
         
         return None
     
-    def run_adx_strategy(self, symbol: str, df: pd.DataFrame) -> Optional[StrategySignal]:
-        """Run ADX strategy and generate signal"""
+    def run_atr_strategy(self, symbol: str, df: pd.DataFrame, sma_20=None,
+                         last_price=None, timestamp: datetime = None) -> Optional[StrategySignal]:
+        """Run ATR-based volatility breakout strategy"""
+        if df is None or len(df) < 20:
+            return None
+        
         try:
-            if df is None or len(df) < 28:
-                return None
-            
-            adx_result = calculate_adx(df)
+            atr_values = calculate_atr(df, period=14)
             
-            if pd.isna(adx_result.iloc[-1]):
+            if len(atr_values) < 2 or math.isnan(float(atr_values.iloc[-1])):
                 return None
             
-            current_adx = adx_result.iloc[-1]
-            current_price = df['close'].iloc[-1]
-            timestamp = datetime.fromtimestamp(df['timestamp'].iloc[-1])
-            
-            # Strong trend (ADX > 25) - determine direction from price action
-            if current_adx > 25:
-                # Simple trend direction: compare current close to 20-period SMA
+            if sma_20 is None:
                 sma_20 = df['close'].rolling(window=20).mean().iloc[-1]
-                
-                if current_price > sma_20:
-                    confidence = min(1.0, (current_adx - 25) / 50)
-                    return StrategySignal(
-                        strategy_name="ADX",
-                        symbol=symbol,
-                        signal="BUY",
-                        price=current_price,
-                        timestamp=timestamp,
-                        confidence=confidence,
-                        metadata={"adx": current_adx, "trend": "strong_uptrend"}
-                    )
-                elif current_price < sma_20:
-                    confidence = min(1.0, (current_adx - 25) / 50)
-                    return StrategySignal(
-                        strategy_name="ADX",
-                        symbol=symbol,
-                        signal="SELL",
-                        price=current_price,
-                        timestamp=timestamp,
-                        confidence=confidence,
-                        metadata={"adx": current_adx, "trend": "strong_downtrend"}
-                    )
+            if last_price is None:
+                last_price = df['close'].iloc[-1]
+            if timestamp is None:
+                timestamp = datetime.fromtimestamp(df['timestamp'].iloc[-1])
+            return self._atr_decision(
+                symbol, atr_values.iloc[-1], atr_values.iloc[-2], sma_20,
+                last_price, df['close'].iloc[-2],
+                timestamp)
                 
         except Exception as e:
-            print(f"ADX strategy error for {symbol}: {e}")
+            _log_strategy_error("ATR", symbol, e)
         
         return None
-    
-    def run_atr_strategy(self, symbol: str, df: pd.DataFrame) -> Optional[StrategySignal]:
-        """Run ATR-based volatility breakout strategy"""
-        try:
-            if df is None or len(df) < 20:
-                return None
-            
-            atr_values = calculate_atr(df, period=14)
-            
-            if len(atr_values) < 2 or pd.isna(atr_values.iloc[-1]):
-                return None
-            
-            current_atr = atr_values.iloc[-1]
-            prev_atr = atr_values.iloc[-2]
-            current_price = df['close'].iloc[-1]
-            prev_close = df['close'].iloc[-2]
-            timestamp = datetime.fromtimestamp(df['timestamp'].iloc[-1])
-            
-            # Calculate 20-period SMA for trend
-            sma_20 = df['close'].rolling(window=20).mean().iloc[-1]
+
+    def _atr_decision(self, symbol: str, current_atr, prev_atr, sma_20,
+                      current_price, prev_close,
+                      timestamp: datetime) -> Optional[StrategySignal]:
+        """ATR volatility-breakout rule on already-extracted scalars."""
+        # ATR breakout strategy: High volatility + price breakout
+        # BUY: Price breaks above SMA + ATR expanding + upward price movement
+        if current_atr > prev_atr * 1.2:  # ATR expanding by 20%
+            price_change = (current_price - prev_close) / prev_close
+            
+            if current_price > sma_20 and price_change > 0.01:  # 1% upward move
+                confidence = min(1.0, abs(price_change) * 10)  # Higher moves = higher confidence
+                return StrategySignal(
+                    strategy_name="ATR",
+                    symbol=symbol,
+                    signal="BUY",
+                    price=current_price,
+                    timestamp=timestamp,
+                    confidence=confidence,
+                    metadata={
+                        "atr": current_atr,
+                        "atr_change": (current_atr - prev_atr) / prev_atr * 100,
+                        "price_change": price_change * 100
+                    }
+                )
             
-            # ATR breakout strategy: High volatility + price breakout
-            # BUY: Price breaks above SMA + ATR expanding + upward price movement
-            if current_atr > prev_atr * 1.2:  # ATR expanding by 20%
-                price_change = (current_price - prev_close) / prev_close
-                
-                if current_price > sma_20 and price_change > 0.01:  # 1% upward move
-                    confidence = min(1.0, abs(price_change) * 10)  # Higher moves = higher confidence
-                    return StrategySignal(
-                        strategy_name="ATR",
-                        symbol=symbol,
-                        signal="BUY",
-                        price=current_price,
-                        timestamp=timestamp,
-                        confidence=confidence,
-                        metadata={
-                            "atr": current_atr,
-                            "atr_change": (current_atr - prev_atr) / prev_atr * 100,
-                            "price_change": price_change * 100
-                        }
-                    )
-                
-                # SELL: Price breaks below SMA + ATR expanding + downward price movement
-                elif current_price < sma_20 and price_change < -0.01:  # 1% downward move
-                    confidence = min(1.0, abs(price_change) * 10)
-                    return StrategySignal(
-                        strategy_name="ATR",
-                        symbol=symbol,
-                        signal="SELL",
-                        price=current_price,
-                        timestamp=timestamp,
-                        confidence=confidence,
-                        metadata={
-                            "atr": current_atr,
-                            "atr_change": (current_atr - prev_atr) / prev_atr * 100,
-                            "price_change": price_change * 100
-                        }
-                    )
-                
-        except Exception as e:
-            print(f"ATR strategy error for {symbol}: {e}")
+            # SELL: Price breaks below SMA + ATR expanding + downward price movement
+            elif current_price < sma_20 and price_change < -0.01:  # 1% downward move
+                confidence = min(1.0, abs(price_change) * 10)
+                return StrategySignal(
+                    strategy_name="ATR",
+                    symbol=symbol,
+                    signal="SELL",
+                    price=current_price,
+                    timestamp=timestamp,
+                    confidence=confidence,
+                    metadata={
+                        "atr": current_atr,
+                        "atr_change": (current_atr - prev_atr) / prev_atr * 100,
+                        "price_change": price_change * 100
+                    }
+                )
         
         return None
     
-    def run_renko_strategy(self, symbol: str, df: pd.DataFrame) -> Optional[StrategySignal]:
+    def run_renko_strategy(self, symbol: str, df: pd.DataFrame,
+                       last_price=None, timestamp: datetime = None) -> Optional[StrategySignal]:
         """Run RENKO chart-based trend strategy"""
+        if df is None or len(df) < 20:
+            return None
+        
         try:
-            if df is None or len(df) < 20:
-                return None
-            
             # Calculate Renko bricks
             renko_df = calculate_renko(df, brick_size=None, atr_period=14, atr_multiplier=1.0)
             
@@ -421,21 +551,15 @@ class AutomatedTradingEngine:
             # Get signal from Renko
             renko_signal = get_renko_signal(renko_df, lookback=3)
             
-            current_price = df['close'].iloc[-1]
-            timestamp = datetime.fromtimestamp(df['timestamp'].iloc[-1])
+            if last_price is None:
+                last_price = df['close'].iloc[-1]
+            if timestamp is None:
+                timestamp = datetime.fromtimestamp(df['timestamp'].iloc[-1])
+            current_price = last_price
             
             # Get trend strength from consecutive bricks
-            recent_bricks = renko_df.tail(5)
-            consecutive_up = 0
-            consecutive_down = 0
-            
-            for trend in recent_bricks['trend'].values:
-                if trend == 1:
-                    consecutive_up += 1
-                    consecutive_down = 0
-                elif trend == -1:
-                    consecutive_down += 1
-                    consecutive_up = 0
+            consecutive_up, consecutive_down = _count_consecutive(
+                renko_df['trend'].to_numpy()[-5:])
             
             # BUY signal: Bullish Renko trend
             if renko_signal == 'BULLISH' and consecutive_up >= 2:
@@ -472,7 +596,7 @@ class AutomatedTradingEngine:
                 )
                 
         except Exception as e:
-            print(f"RENKO strategy error for {symbol}: {e}")
+            _log_strategy_error("RENKO", symbol, e)
         
         return None
     
@@ -485,22 +609,21 @@ class AutomatedTradingEngine:
         if not signals:
             return None
         
-        buy_votes = 0
-        sell_votes = 0
-        buy_confidence = 0
-        sell_confidence = 0
-        buy_strategies = []
-        sell_strategies = []
-        
-        for signal in signals:
-            if signal.signal == "BUY":
-                buy_votes += 1
-                buy_confidence += signal.confidence
-                buy_strategies.append(signal.strategy_name)
-            elif signal.signal == "SELL":
-                sell_votes += 1
-                sell_confidence += signal.confidence
-                sell_strategies.append(signal.strategy_name)
+        # Tally as packed arrays: one pass to int8 vote directions and
+        # float64 confidences, then the counts and confidence sums are
+        # vectorized reductions instead of per-signal Python branching
+        count = len(signals)
+        sides = np.fromiter(
+            (1 if s.signal == "BUY" else -1 if s.signal == "SELL" else 0
+             for s in signals), dtype=np.int8, count=count)
+        confidences = np.fromiter((s.confidence for s in signals),
+                                  dtype=np.float64, count=count)
+        buy_mask = sides == 1
+        sell_mask = sides == -1
+        buy_votes = int(buy_mask.sum())
+        sell_votes = int(sell_mask.sum())
+        buy_confidence = float(confidences[buy_mask].sum())
+        sell_confidence = float(confidences[sell_mask].sum())
         
         # Need majority vote (>50%) to execute
         total_votes = buy_votes + sell_votes
@@ -514,6 +637,8 @@ class AutomatedTradingEngine:
         # Require majority vote (more buy than sell votes, or vice versa)
         # And minimum confidence of 0.3
         if buy_votes > sell_votes and avg_buy_confidence > 0.3:
+            buy_strategies = [s.strategy_name for s in signals if s.signal == "BUY"]
+            sell_strategies = [s.strategy_name for s in signals if s.signal == "SELL"]
             final_confidence = avg_buy_confidence * (buy_votes / total_votes)
             strategies_str = ", ".join(buy_strategies)
             print(f"[AGGREGATE] BUY signal from [{strategies_str}]: {buy_votes} buy votes vs {sell_votes} sell votes, confidence: {final_confidence:.2f}")
@@ -533,6 +658,8 @@ class AutomatedTradingEngine:
                 }
             )
         elif sell_votes > buy_votes and avg_sell_confidence > 0.3:
+            buy_strategies = [s.strategy_name for s in signals if s.signal == "BUY"]
+            sell_strategies = [s.strategy_name for s in signals if s.signal == "SELL"]
             final_confidence = avg_sell_confidence * (sell_votes / total_votes)
             strategies_str = ", ".join(sell_strategies)
             print(f"[AGGREGATE] SELL signal from [{strategies_str}]: {sell_votes} sell votes vs {buy_votes} buy votes, confidence: {final_confidence:.2f}")
@@ -728,36 +855,311 @@ class AutomatedTradingEngine:
         
         Returns list of generated signals.
         """
-        signals = []
-        
-        # Convert candles to DataFrame for indicator calculations
         if not data or 'candles' not in data or len(data['candles']) == 0:
-            return signals
+            return []
+        
+        candles = data['candles']
+        cache = self._indicator_cache.get(symbol)
+        if cache is not None and len(candles) <= cache['n']:
+            # Backtest hot path: candles are a prefix of the cached full
+            # history, so per-bar values are O(1) array reads
+            signals = self._signals_from_cache(symbol, candles, cache)
+        else:
+            df, sma_20, last_price, timestamp = self._prepare_bar(candles)
+            signals = [s for s in (
+                self._run_one_strategy(name, symbol, df, sma_20, last_price, timestamp)
+                for name in self.config.strategies
+            ) if s]
+        
+        self._register_signals(signals)
+        return signals
+
+    async def run_strategies_async(self, symbol: str, data: Dict[str, Any]) -> List[StrategySignal]:
+        """Async variant of run_strategies for the live loop.
+
+        On the uncached path the strategies are independent full-window
+        indicator computations that spend their time in pandas/numpy C
+        code, so they are dispatched concurrently via asyncio.to_thread;
+        gather preserves the configured strategy order.
+        """
+        if not data or 'candles' not in data or len(data['candles']) == 0:
+            return []
+        
+        candles = data['candles']
+        cache = self._indicator_cache.get(symbol)
+        if cache is not None and len(candles) <= cache['n']:
+            signals = self._signals_from_cache(symbol, candles, cache)
+        else:
+            df, sma_20, last_price, timestamp = self._prepare_bar(candles)
+            entry = self._update_live_states(symbol, candles)
+            results: Dict[str, Optional[StrategySignal]] = {}
+            pending = []
+            for name in self.config.strategies:
+                if entry is not None and name in self._STATE_BACKED:
+                    results[name] = self._signal_from_live_state(
+                        name, symbol, entry, last_price, timestamp)
+                else:
+                    pending.append(name)
+            if pending:
+                computed = await asyncio.gather(*(
+                    asyncio.to_thread(self._run_one_strategy, name, symbol, df,
+                                      sma_20, last_price, timestamp)
+                    for name in pending
+                ))
+                results.update(zip(pending, computed))
+            signals = [results[name] for name in self.config.strategies
+                       if results.get(name)]
+        
+        self._register_signals(signals)
+        return signals
+
+    def _update_live_states(self, symbol: str, candles: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Advance this symbol's streaming indicator states.
+
+        Feeds only candles newer than the last seen timestamp, so a
+        refetched overlapping window costs one state update per truly
+        new bar. Returns None when no configured strategy is
+        state-backed.
+        """
+        strategies = self._STATE_BACKED & set(self.config.strategies)
+        if not strategies:
+            return None
         
-        # Create DataFrame from candles
-        df = pd.DataFrame(data['candles'])
+        entry = self._live_states.get(symbol)
+        if entry is None:
+            entry = {
+                'last_ts': None,
+                'count': 0,
+                'close': None,
+                'prev_close': None,
+                'rsi': RSIState(period=14) if "RSI" in strategies else None,
+                'rsi_curr': math.nan, 'rsi_prev': math.nan,
+                'macd': MACDState() if "MACD" in strategies else None,
+                'macd_curr': None, 'macd_prev': None,
+                'atr': ATRState(period=14) if "ATR" in strategies else None,
+                'atr_curr': math.nan, 'atr_prev': math.nan,
+                # the Bollinger window also supplies the 20-bar SMA the
+                # ATR rule consults
+                'bb': (BollingerState(period=20)
+                       if strategies & {"BOLLINGER", "ATR"} else None),
+                'bb_bands': (math.nan, math.nan, math.nan),
+            }
+            self._live_states[symbol] = entry
+        
+        last_ts = entry['last_ts']
+        for candle in candles:
+            ts = candle['timestamp']
+            if last_ts is not None and ts <= last_ts:
+                continue
+            last_ts = ts
+            close = candle['close']
+            entry['count'] += 1
+            entry['prev_close'] = entry['close']
+            entry['close'] = close
+            if entry['rsi'] is not None:
+                entry['rsi_prev'] = entry['rsi_curr']
+                entry['rsi_curr'] = entry['rsi'].update(close)
+            if entry['macd'] is not None:
+                entry['macd_prev'] = entry['macd_curr']
+                macd, macd_signal, _ = entry['macd'].update(close)
+                entry['macd_curr'] = (macd, macd_signal)
+            if entry['atr'] is not None:
+                entry['atr_prev'] = entry['atr_curr']
+                entry['atr_curr'] = entry['atr'].update(
+                    candle['high'], candle['low'], close)
+            if entry['bb'] is not None:
+                entry['bb_bands'] = entry['bb'].update(close)
+        entry['last_ts'] = last_ts
+        return entry
+
+    def _signal_from_live_state(self, strategy_name: str, symbol: str,
+                                entry: Dict[str, Any], last_price,
+                                timestamp: datetime) -> Optional[StrategySignal]:
+        """Evaluate one state-backed strategy from its streaming values.
+
+        The count gates mirror the minimum window lengths of the
+        DataFrame-based methods.
+        """
+        count = entry['count']
+        if strategy_name == "RSI":
+            curr, prev = entry['rsi_curr'], entry['rsi_prev']
+            if count >= 15 and not (math.isnan(curr) or math.isnan(prev)):
+                return self._rsi_decision(symbol, curr, prev, last_price, timestamp)
+        elif strategy_name == "MACD":
+            if count >= 26 and entry['macd_prev'] is not None:
+                macd, macd_signal = entry['macd_curr']
+                prev_macd, prev_signal = entry['macd_prev']
+                return self._macd_decision(symbol, macd, macd_signal,
+                                           prev_macd, prev_signal,
+                                           last_price, timestamp)
+        elif strategy_name == "ATR":
+            curr, prev = entry['atr_curr'], entry['atr_prev']
+            sma_20 = entry['bb'].mean
+            if (count >= 20 and not (math.isnan(curr) or math.isnan(prev))
+                    and not math.isnan(sma_20)):
+                return self._atr_decision(symbol, curr, prev, sma_20,
+                                          last_price, entry['prev_close'],
+                                          timestamp)
+        elif strategy_name == "BOLLINGER":
+            upper, middle, lower = entry['bb_bands']
+            if count >= 20 and not math.isnan(middle):
+                return self._bollinger_decision(symbol, upper, lower,
+                                                last_price, timestamp)
+        return None
+
+    def _prepare_bar(self, candles: List[Dict[str, Any]]) -> tuple:
+        """Shared per-bar setup for the uncached strategy paths."""
+        df = pd.DataFrame(candles)
+        # Pull the bar tail out of pandas once: every strategy needs
+        # the same last price and timestamp
+        last_price = df['close'].iloc[-1]
+        timestamp = datetime.fromtimestamp(df['timestamp'].iloc[-1])
+        # ADX and ATR both consult the same 20-period SMA; compute
+        # it once per bar and hand it to both
+        sma_20 = None
+        if len(df) >= 20 and ({"ADX", "ATR"} & set(self.config.strategies)):
+            sma_20 = df['close'].rolling(window=20).mean().iloc[-1]
+        return df, sma_20, last_price, timestamp
+
+    def _run_one_strategy(self, strategy_name: str, symbol: str, df: pd.DataFrame,
+                          sma_20, last_price,
+                          timestamp: datetime) -> Optional[StrategySignal]:
+        """Dispatch a single configured strategy on a prepared bar."""
+        if strategy_name == "RSI":
+            return self.run_rsi_strategy(symbol, df, last_price, timestamp)
+        elif strategy_name == "MACD":
+            return self.run_macd_strategy(symbol, df, last_price, timestamp)
+        elif strategy_name == "SUPERTREND":
+            return self.run_supertrend_strategy(symbol, df, last_price, timestamp)
+        elif strategy_name == "BOLLINGER":
+            return self.run_bollinger_strategy(symbol, df, last_price, timestamp)
+        elif strategy_name == "ADX":
+            return self.run_adx_strategy(symbol, df, sma_20, last_price, timestamp)
+        elif strategy_name == "ATR":
+            return self.run_atr_strategy(symbol, df, sma_20, last_price, timestamp)
+        elif strategy_name == "RENKO":
+            return self.run_renko_strategy(symbol, df, last_price, timestamp)
+        return None
+
+    def _register_signals(self, signals: List[StrategySignal]) -> None:
+        """Record generated signals in the history and breakdown counters."""
+        for signal in signals:
+            self.all_signals.push(signal.strategy_name, signal.symbol,
+                                  signal.signal, signal.price,
+                                  signal.timestamp, signal.confidence)
+            counts = self._signal_breakdown.setdefault(
+                signal.strategy_name, {"BUY": 0, "SELL": 0, "total": 0})
+            counts[signal.signal] += 1
+            counts["total"] += 1
+
+    def _prime_indicator_cache(self, symbol: str, candles: List[Dict[str, Any]]) -> None:
+        """Precompute full-history indicator arrays for one symbol.
+
+        All the cached indicators are causal recursions or rolling
+        windows, so the value at bar i matches what recomputing over
+        candles[:i + 1] would produce at its last row.
+        """
+        df = pd.DataFrame(candles)
+        n = len(df)
+        strategies = set(self.config.strategies)
+        cache: Dict[str, Any] = {
+            'n': n,
+            'close': df['close'].to_numpy(dtype=np.float64),
+            'timestamp': df['timestamp'].to_numpy(dtype=np.int64),
+        }
+        try:
+            if "RSI" in strategies and n >= 15:
+                cache['rsi'] = calculate_rsi(df, period=14).to_numpy()
+            if "MACD" in strategies and n >= 26:
+                macd_result = calculate_macd(df)
+                cache['macd'] = macd_result['macd'].to_numpy()
+                cache['macd_signal'] = macd_result['signal'].to_numpy()
+            if "SUPERTREND" in strategies and n >= 10:
+                st_result = calculate_supertrend(df)
+                cache['st_direction'] = st_result['direction'].to_numpy()
+                cache['st_value'] = st_result['supertrend'].to_numpy()
+            if "BOLLINGER" in strategies and n >= 20:
+                bb_result = calculate_bollinger_bands(df)
+                cache['bb_upper'] = bb_result['upper_band'].to_numpy()
+                cache['bb_middle'] = bb_result['middle_band'].to_numpy()
+                cache['bb_lower'] = bb_result['lower_band'].to_numpy()
+            if "ADX" in strategies and n >= 28:
+                cache['adx'] = calculate_adx(df).to_numpy()
+            if "ATR" in strategies and n >= 20:
+                cache['atr'] = calculate_atr(df, period=14).to_numpy()
+            if strategies & {"ADX", "ATR"} and n >= 20:
+                cache['sma20'] = df['close'].rolling(window=20).mean().to_numpy()
+        except Exception as e:
+            print(f"Indicator cache error for {symbol}: {e}")
+            return
+        self._indicator_cache[symbol] = cache
+
+    def _signals_from_cache(self, symbol: str, candles: List[Dict[str, Any]],
+                            cache: Dict[str, Any]) -> List[StrategySignal]:
+        """Evaluate the configured strategies at one bar from cached arrays.
+
+        Gating mirrors the per-strategy minimum lengths of the uncached
+        methods, applied to the prefix length rather than the full
+        history. RENKO stays on the DataFrame path: its adaptive brick
+        size is derived from the whole window, so it is not causal.
+        """
+        i = len(candles) - 1
+        current_price = float(cache['close'][i])
+        timestamp = datetime.fromtimestamp(int(cache['timestamp'][i]))
+        signals = []
+        renko_df = None
         
         for strategy_name in self.config.strategies:
             signal = None
-            
-            if strategy_name == "RSI":
-                signal = self.run_rsi_strategy(symbol, df)
-            elif strategy_name == "MACD":
-                signal = self.run_macd_strategy(symbol, df)
-            elif strategy_name == "SUPERTREND":
-                signal = self.run_supertrend_strategy(symbol, df)
-            elif strategy_name == "BOLLINGER":
-                signal = self.run_bollinger_strategy(symbol, df)
-            elif strategy_name == "ADX":
-                signal = self.run_adx_strategy(symbol, df)
-            elif strategy_name == "ATR":
-                signal = self.run_atr_strategy(symbol, df)
-            elif strategy_name == "RENKO":
-                signal = self.run_renko_strategy(symbol, df)
+            try:
+                if strategy_name == "RSI":
+                    rsi = cache.get('rsi')
+                    if rsi is not None and i >= 14 and not math.isnan(rsi[i]):
+                        signal = self._rsi_decision(
+                            symbol, rsi[i], rsi[i - 1], current_price, timestamp)
+                elif strategy_name == "MACD":
+                    macd = cache.get('macd')
+                    if macd is not None and i >= 25 and not math.isnan(macd[i]):
+                        macd_signal = cache['macd_signal']
+                        signal = self._macd_decision(
+                            symbol, macd[i], macd_signal[i],
+                            macd[i - 1], macd_signal[i - 1],
+                            current_price, timestamp)
+                elif strategy_name == "SUPERTREND":
+                    direction = cache.get('st_direction')
+                    if direction is not None and i >= 9:
+                        signal = self._supertrend_decision(
+                            symbol, direction[i], direction[i - 1],
+                            cache['st_value'][i], current_price, timestamp)
+                elif strategy_name == "BOLLINGER":
+                    bb_middle = cache.get('bb_middle')
+                    if bb_middle is not None and i >= 19 and not math.isnan(bb_middle[i]):
+                        signal = self._bollinger_decision(
+                            symbol, cache['bb_upper'][i], cache['bb_lower'][i],
+                            current_price, timestamp)
+                elif strategy_name == "ADX":
+                    adx = cache.get('adx')
+                    if adx is not None and i >= 27 and not math.isnan(adx[i]):
+                        signal = self._adx_decision(
+                            symbol, adx[i], cache['sma20'][i],
+                            current_price, timestamp)
+                elif strategy_name == "ATR":
+                    atr = cache.get('atr')
+                    if atr is not None and i >= 19 and not math.isnan(atr[i]):
+                        signal = self._atr_decision(
+                            symbol, atr[i], atr[i - 1], cache['sma20'][i],
+                            current_price, float(cache['close'][i - 1]),
+                            timestamp)
+                elif strategy_name == "RENKO":
+                    if renko_df is None:
+                        renko_df = pd.DataFrame(candles)
+                    signal = self.run_renko_strategy(symbol, renko_df,
+                                                     current_price, timestamp)
+            except Exception as e:
+                _log_strategy_error(strategy_name, symbol, e)
             
             if signal:
                 signals.append(signal)
-                self.all_signals.append(signal)
         
         return signals
     
@@ -838,6 +1240,10 @@ class AutomatedTradingEngine:
             if data and 'candles' in data:
                 symbol_data[symbol] = data
                 print(f"[OK] Got {len(data['candles'])} candles for {symbol}")
+                # One indicator pass over the full history; the bar loop
+                # below then reads per-bar values instead of recomputing
+                # every indicator over a growing prefix
+                self._prime_indicator_cache(symbol, data['candles'])
             else:
                 print(f"[ERROR] No data available for {symbol}")
         
@@ -935,9 +1341,9 @@ class AutomatedTradingEngine:
                         else:
                             print(f"[WARNING] Failed to execute trade for {symbol}")
             
-            # Track daily P&L
-            if current_date not in self.daily_pnl:
-                self.daily_pnl[current_date] = self.engine.portfolio.total_pnl
+            # Track daily P&L (first write per day wins, as before)
+            self._record_daily_pnl(current_date, self.engine.portfolio.total_pnl,
+                                   overwrite=False)
         
         # Print final summary
         print(f"\n[COMPLETE] Backtest completed!")
@@ -1005,8 +1411,9 @@ class AutomatedTradingEngine:
                     if symbol not in symbol_data:
                         continue
                     
-                    # Run all strategies
-                    signals = self.run_strategies(symbol, symbol_data[symbol])
+                    # Run all strategies concurrently (each is an
+                    # independent indicator pass over this window)
+                    signals = await self.run_strategies_async(symbol, symbol_data[symbol])
                     
                     if signals:
                         print(f"[LIVE] {symbol}: Generated {len(signals)} signals")
@@ -1019,8 +1426,8 @@ class AutomatedTradingEngine:
                             if success:
                                 print(f"[LIVE TRADE] Executed {aggregated_signal.signal} for {symbol} at Rs.{aggregated_signal.price:.2f}")
                 
-                # Track daily P&L
-                self.daily_pnl[current_date] = self.engine.portfolio.total_pnl
+                # Track daily P&L (latest value per day)
+                self._record_daily_pnl(current_date, self.engine.portfolio.total_pnl)
                 
                 # Wait before next iteration (5 minutes for 5-min timeframe)
                 await asyncio.sleep(300)
@@ -1044,10 +1451,15 @@ class AutomatedTradingEngine:
         # === STEP 1: Get portfolio state ===
         portfolio = self.engine.portfolio
         initial_capital = portfolio.initial_capital
-        
+
+        # Sync the columnar trade store up front; P&L components and the
+        # trade statistics below are NumPy reductions over its columns
+        self._sync_trades_table(portfolio.closed_positions)
+        net_pnl_column = self._trades_table.column('net_pnl')
+
         # === STEP 2: Calculate P&L components (COMPONENT SOURCE OF TRUTH) ===
         # Realized P&L: Sum of all closed positions (money locked in)
-        realized_pnl = sum(pos.realized_pnl for pos in portfolio.closed_positions)
+        realized_pnl = float(net_pnl_column.sum())
         
         # Unrealized P&L: Sum of all open positions (paper gains/losses)
         unrealized_pnl = sum(pos.unrealized_pnl for pos in portfolio.positions.values())
@@ -1055,18 +1467,12 @@ class AutomatedTradingEngine:
         # Total charges (brokerage + other costs)
         total_charges = portfolio.total_brokerage_paid
         
-        # === STEP 3: Calculate FINAL VALUE (SINGLE SOURCE OF TRUTH) ===
-        # CRITICAL: This is THE authoritative calculation
+        # === STEPS 3-5: Derive the accounting identity in one pass ===
         # Final Value = Initial Capital + Realized P&L + Unrealized P&L - Charges
-        final_value = initial_capital + realized_pnl + unrealized_pnl - total_charges
-        
-        # === STEP 4: Derive Total P&L from Final Value (NOT independent calculation) ===
         # Total P&L = Final Value - Initial Capital
-        total_pnl = final_value - initial_capital
-        
-        # === STEP 5: Derive Returns from Final Value (NOT from P&L) ===
-        # Returns % = (Final Value - Initial Capital) / Initial Capital * 100
-        returns_percent = ((final_value - initial_capital) / initial_capital) * 100
+        # Returns % = Total P&L / Initial Capital * 100
+        final_value, total_pnl, returns_percent = _derive_identity(
+            initial_capital, realized_pnl, unrealized_pnl, total_charges)
         
         # === STEP 6: Validate mathematical consistency ===
         # Check 1: Realized + Unrealized - Charges = Total P&L
@@ -1097,29 +1503,26 @@ class AutomatedTradingEngine:
         invested_capital = portfolio.invested_capital
         
         # === STEP 7: Calculate Trade Statistics (from closed positions only) ===
+        # One masked pass over the contiguous net P&L column instead of
+        # four Python generator sweeps over position objects
         closed_positions = portfolio.closed_positions
         total_trades = len(closed_positions)
-        
-        winning_trades = sum(1 for pos in closed_positions if pos.realized_pnl > 0)
-        losing_trades = sum(1 for pos in closed_positions if pos.realized_pnl < 0)
-        
+
+        wins_mask = net_pnl_column > 0
+        losses_mask = net_pnl_column < 0
+        winning_trades = int(wins_mask.sum())
+        losing_trades = int(losses_mask.sum())
+
         # Validate: Wins + Losses = Total Trades
         if winning_trades + losing_trades != total_trades:
             print(f"[ERROR] Trade count mismatch: {winning_trades} + {losing_trades} != {total_trades}")
-        
+
         win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
-        
+
         # Average Win/Loss
-        avg_win = (
-            sum(pos.realized_pnl for pos in closed_positions if pos.realized_pnl > 0) / winning_trades
-            if winning_trades > 0 else 0
-        )
-        
-        avg_loss = (
-            sum(pos.realized_pnl for pos in closed_positions if pos.realized_pnl < 0) / losing_trades
-            if losing_trades > 0 else 0
-        )
-        
+        avg_win = float(net_pnl_column[wins_mask].mean()) if winning_trades > 0 else 0
+        avg_loss = float(net_pnl_column[losses_mask].mean()) if losing_trades > 0 else 0
+
         profit_factor = abs(avg_win / avg_loss) if avg_loss != 0 else 0
         
         # === STEP 8: Validate P&L sum from trade statistics ===
@@ -1130,36 +1533,26 @@ class AutomatedTradingEngine:
             print(f"[WARNING] Realized P&L validation: Calculated={calculated_realized_pnl:.2f}, Actual={realized_pnl:.2f}")
         
         # === STEP 9: Prepare executed trades with complete entry/exit data ===
-        executed_trades_with_exits = []
-        for pos in closed_positions:
-            trade = {
-                "symbol": pos.symbol,
-                "entry_side": pos.side.value,
-                "entry_price": pos.entry_price,
-                "entry_timestamp": pos.entry_time.isoformat() if pos.entry_time else None,
-                "quantity": pos.quantity,
-                "exit_side": "SELL" if pos.side.value == "LONG" else "BUY",
-                "exit_price": pos.exit_price if pos.exit_price else pos.current_price,
-                "exit_timestamp": pos.exit_time.isoformat() if pos.exit_time else datetime.now().isoformat(),
-                "exit_reason": getattr(pos, 'exit_reason', 'AUTO_EXIT'),
-                "strategy": getattr(pos, 'strategy', 'UNKNOWN'),
-                "stop_loss": getattr(pos, 'stop_loss', None),
-                "target": getattr(pos, 'target', None),
-                "gross_pnl": pos.realized_pnl + portfolio.brokerage_per_trade,  # Add back brokerage
-                "brokerage": portfolio.brokerage_per_trade,
-                "net_pnl": pos.realized_pnl,
-                "holding_period_minutes": self._calculate_holding_period(pos)
-            }
-            executed_trades_with_exits.append(trade)
+        # The dict-per-trade shape is materialized from the column store
+        # (synced in STEP 1) at serialization time only
+        executed_trades_with_exits = self._trades_table.to_records()
         
         # === STEP 10: Build equity curve ===
-        equity_curve = []
-        for date_key, pnl in sorted(self.daily_pnl.items()):
-            equity_curve.append({
-                "date": str(date_key),
-                "portfolio_value": initial_capital + pnl,
-                "pnl": pnl
-            })
+        # Recorded days fall out of one NaN mask (offsets are already in
+        # date order) and portfolio values from one vectorized add; the
+        # per-day dicts exist only as payload rows
+        recorded = np.nonzero(~np.isnan(self._daily_pnl))[0]
+        pnl_values = self._daily_pnl[recorded]
+        portfolio_values = initial_capital + pnl_values
+        start_date = self.config.start_date
+        equity_curve = [
+            {
+                "date": (start_date + timedelta(days=int(offset))).isoformat(),
+                "portfolio_value": float(value),
+                "pnl": float(pnl)
+            }
+            for offset, value, pnl in zip(recorded, portfolio_values, pnl_values)
+        ]
         
         # === STEP 11: Return comprehensive results (ALL VALUES DERIVED FROM FINAL VALUE) ===
         return {
@@ -1213,28 +1606,67 @@ class AutomatedTradingEngine:
             "executed_trades": executed_trades_with_exits,
             
             # Daily tracking
-            "daily_pnl": {str(k): round(v, 2) for k, v in self.daily_pnl.items()},
+            "daily_pnl": self._daily_pnl_as_dict(),
             "equity_curve": equity_curve,
         }
     
-    def _calculate_holding_period(self, position) -> int:
-        """Calculate holding period in minutes"""
-        if hasattr(position, 'entry_time') and hasattr(position, 'exit_time'):
-            if position.entry_time and position.exit_time:
-                delta = position.exit_time - position.entry_time
-                return int(delta.total_seconds() / 60)
-        return 0
+    def _record_daily_pnl(self, day: date, pnl: float, *, overwrite: bool = True) -> None:
+        """Store one day's cumulative P&L at its offset from start_date.
+
+        Live trading can run past the configured end_date, so the array
+        grows (by day, not by doubling — the axis is calendar time) when
+        an offset lands beyond the current length.
+        """
+        idx = (day - self.config.start_date).days
+        if idx < 0:
+            return
+        if idx >= len(self._daily_pnl):
+            bigger = np.full(idx + 1, np.nan)
+            bigger[:len(self._daily_pnl)] = self._daily_pnl
+            self._daily_pnl = bigger
+        if overwrite or math.isnan(self._daily_pnl[idx]):
+            self._daily_pnl[idx] = pnl
+
+    def _daily_pnl_as_dict(self) -> Dict[str, float]:
+        """Materialize the date-string -> P&L dict for the results payload."""
+        start_date = self.config.start_date
+        return {
+            (start_date + timedelta(days=i)).isoformat(): round(float(v), 2)
+            for i, v in enumerate(self._daily_pnl)
+            if not math.isnan(v)
+        }
+
+    def _sync_trades_table(self, closed_positions: List) -> None:
+        """Append newly closed positions to the columnar trade store.
+
+        closed_positions only ever grows, so everything past the table's
+        current length is new.
+        """
+        brokerage = self.engine.portfolio.brokerage_per_trade
+        table = self._trades_table
+        for pos in closed_positions[len(table):]:
+            table.append(
+                symbol=pos.symbol,
+                entry_side=pos.side.value,
+                entry_price=pos.entry_price,
+                entry_ts=pos.entry_time,
+                quantity=pos.quantity,
+                exit_side="SELL" if pos.side.value == "LONG" else "BUY",
+                exit_price=pos.exit_price if pos.exit_price else pos.current_price,
+                exit_ts=pos.exit_time if pos.exit_time else datetime.now(),
+                exit_reason=getattr(pos, 'exit_reason', 'AUTO_EXIT'),
+                strategy=getattr(pos, 'strategy', 'UNKNOWN'),
+                stop_loss=getattr(pos, 'stop_loss', None),
+                target=getattr(pos, 'target', None),
+                gross_pnl=pos.realized_pnl + brokerage,  # Add back brokerage
+                brokerage=brokerage,
+                net_pnl=pos.realized_pnl,
+            )
     
     def _get_signal_breakdown(self) -> Dict[str, Any]:
-        """Get breakdown of signals by strategy and type"""
-        breakdown = {}
-        
-        for signal in self.all_signals:
-            strategy = signal.strategy_name
-            if strategy not in breakdown:
-                breakdown[strategy] = {"BUY": 0, "SELL": 0, "total": 0}
-            
-            breakdown[strategy][signal.signal] += 1
-            breakdown[strategy]["total"] += 1
-        
-        return breakdown
+        """Get breakdown of signals by strategy and type.
+
+        The counters are kept current in run_strategies; this no longer
+        re-walks the full signal list per call.
+        """
+        return self._signal_breakdown
@@ -0,0 +1,68 @@
+"""
+Columnar (structure-of-arrays) history of generated strategy signals.
+
+A long backtest can emit tens of thousands of signals, and keeping each
+as a StrategySignal object (a dict-backed instance plus a metadata dict)
+holds hundreds of bytes per signal alive for the whole run even though
+post-run consumers only ever count them. Packing the history into
+parallel arrays keeps it a few bytes per signal and leaves it ready for
+vectorized analytics.
+"""
+
+from datetime import datetime
+from typing import Dict
+
+import numpy as np
+
+_SIDE_CODES = {"BUY": 1, "SELL": -1}
+
+
+class SignalBuffer:
+    """Append-only column store for the signal history.
+
+    Strategy and symbol names are interned to small integer ids; the
+    columns are preallocated and grown by doubling, so appends are
+    amortized O(1).
+    """
+
+    def __init__(self, capacity: int = 256):
+        self._size = 0
+        self._strategy_ids: Dict[str, int] = {}
+        self._symbol_ids: Dict[str, int] = {}
+        self._strategy = np.empty(capacity, dtype=np.int16)
+        self._symbol = np.empty(capacity, dtype=np.int16)
+        self._side = np.empty(capacity, dtype=np.int8)
+        self._price = np.empty(capacity, dtype=np.float64)
+        self._ts = np.empty(capacity, dtype='datetime64[ns]')
+        self._confidence = np.empty(capacity, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _grow(self) -> None:
+        for name in ('_strategy', '_symbol', '_side', '_price', '_ts', '_confidence'):
+            arr = getattr(self, name)
+            bigger = np.empty(len(arr) * 2, dtype=arr.dtype)
+            bigger[:self._size] = arr[:self._size]
+            setattr(self, name, bigger)
+
+    def _intern(self, table: Dict[str, int], name: str) -> int:
+        code = table.get(name)
+        if code is None:
+            code = len(table)
+            table[name] = code
+        return code
+
+    def push(self, strategy_name: str, symbol: str, side: str, price: float,
+             timestamp: datetime, confidence: float) -> None:
+        """Record one generated signal."""
+        if self._size == len(self._side):
+            self._grow()
+        i = self._size
+        self._strategy[i] = self._intern(self._strategy_ids, strategy_name)
+        self._symbol[i] = self._intern(self._symbol_ids, symbol)
+        self._side[i] = _SIDE_CODES.get(side, 0)
+        self._price[i] = price
+        self._ts[i] = np.datetime64(timestamp)
+        self._confidence[i] = confidence
+        self._size = i + 1
@@ -0,0 +1,130 @@
+"""
+Columnar (structure-of-arrays) storage for completed round-trip trades.
+
+A list of per-trade dicts costs ~14 key slots plus a dict header per
+trade; for long sessions that is megabytes of pure Python-object
+overhead, and every statistic over it is a Python loop. Storing each
+field as one contiguous array keeps numeric columns in float64/int64
+buffers that NumPy can reduce directly, and materializes dicts only
+when a JSON payload actually needs them.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+class TradesTable:
+    """Append-only column store for closed trades.
+
+    Columns are preallocated and grown by doubling, so appends are
+    amortized O(1). Numeric columns (prices, P&L, quantity) are packed
+    arrays; strings and optional floats stay object arrays.
+    """
+
+    _FLOAT_COLUMNS = ('entry_price', 'exit_price', 'gross_pnl', 'brokerage', 'net_pnl')
+    _INT_COLUMNS = ('quantity',)
+    _TS_COLUMNS = ('entry_ts', 'exit_ts')
+    _OBJECT_COLUMNS = ('symbol', 'entry_side', 'exit_side', 'exit_reason',
+                       'strategy', 'stop_loss', 'target')
+
+    def __init__(self, capacity: int = 64):
+        self._size = 0
+        self._columns: Dict[str, np.ndarray] = {}
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        for name in self._FLOAT_COLUMNS:
+            self._columns[name] = np.empty(capacity, dtype=np.float64)
+        for name in self._INT_COLUMNS:
+            self._columns[name] = np.empty(capacity, dtype=np.int64)
+        for name in self._TS_COLUMNS:
+            self._columns[name] = np.empty(capacity, dtype='datetime64[ns]')
+        for name in self._OBJECT_COLUMNS:
+            self._columns[name] = np.empty(capacity, dtype=object)
+
+    def _grow(self) -> None:
+        for name, arr in self._columns.items():
+            bigger = np.empty(len(arr) * 2, dtype=arr.dtype)
+            bigger[:self._size] = arr[:self._size]
+            self._columns[name] = bigger
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, *, symbol: str, entry_side: str, entry_price: float,
+               entry_ts: datetime, quantity: int, exit_side: str,
+               exit_price: float, exit_ts: datetime, exit_reason: str,
+               strategy: str, stop_loss: Optional[float],
+               target: Optional[float], gross_pnl: float, brokerage: float,
+               net_pnl: float) -> None:
+        """Record one completed trade."""
+        if self._size == len(self._columns['net_pnl']):
+            self._grow()
+        i = self._size
+        cols = self._columns
+        cols['symbol'][i] = symbol
+        cols['entry_side'][i] = entry_side
+        cols['entry_price'][i] = entry_price
+        cols['entry_ts'][i] = np.datetime64(entry_ts)
+        cols['quantity'][i] = quantity
+        cols['exit_side'][i] = exit_side
+        cols['exit_price'][i] = exit_price
+        cols['exit_ts'][i] = np.datetime64(exit_ts)
+        cols['exit_reason'][i] = exit_reason
+        cols['strategy'][i] = strategy
+        cols['stop_loss'][i] = stop_loss
+        cols['target'][i] = target
+        cols['gross_pnl'][i] = gross_pnl
+        cols['brokerage'][i] = brokerage
+        cols['net_pnl'][i] = net_pnl
+        self._size = i + 1
+
+    def column(self, name: str) -> np.ndarray:
+        """View (not copy) of a column's filled portion."""
+        return self._columns[name][:self._size]
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Materialize the per-trade dicts for JSON serialization.
+
+        This is the only place the dict-per-trade shape exists; the
+        holding period comes from one vectorized timestamp subtraction.
+        """
+        n = self._size
+        if n == 0:
+            return []
+        cols = self._columns
+        holding = ((cols['exit_ts'][:n] - cols['entry_ts'][:n])
+                   // np.timedelta64(60, 's')).astype(np.int64)
+        entry_iso = [ts.isoformat() for ts in cols['entry_ts'][:n].astype('datetime64[us]').astype(object)]
+        exit_iso = [ts.isoformat() for ts in cols['exit_ts'][:n].astype('datetime64[us]').astype(object)]
+        # Bind each column to a local once; the per-trade loop then does
+        # plain index reads instead of a dict lookup per field per row
+        symbol, entry_side, exit_side = cols['symbol'], cols['entry_side'], cols['exit_side']
+        exit_reason, strategy = cols['exit_reason'], cols['strategy']
+        stop_loss, target = cols['stop_loss'], cols['target']
+        entry_price, exit_price = cols['entry_price'], cols['exit_price']
+        quantity = cols['quantity']
+        gross_pnl, brokerage, net_pnl = cols['gross_pnl'], cols['brokerage'], cols['net_pnl']
+        return [
+            {
+                "symbol": symbol[i],
+                "entry_side": entry_side[i],
+                "entry_price": float(entry_price[i]),
+                "entry_timestamp": entry_iso[i],
+                "quantity": int(quantity[i]),
+                "exit_side": exit_side[i],
+                "exit_price": float(exit_price[i]),
+                "exit_timestamp": exit_iso[i],
+                "exit_reason": exit_reason[i],
+                "strategy": strategy[i],
+                "stop_loss": stop_loss[i],
+                "target": target[i],
+                "gross_pnl": float(gross_pnl[i]),
+                "brokerage": float(brokerage[i]),
+                "net_pnl": float(net_pnl[i]),
+                "holding_period_minutes": int(holding[i]),
+            }
+            for i in range(n)
+        ]
@@ -5,6 +5,7 @@ FastAPI routes for automated trading with multiple strategies.
 """
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import date, datetime, timezone, timedelta
@@ -208,7 +209,10 @@ async def run_historical_trading(session_id: str, engine: AutomatedTradingEngine
         print(f"[DEBUG] Portfolio data: {portfolio}")
         print(f"[DEBUG] Performance data: {performance}")
         
-        result_data = AutoTradingResult(
+        # Everything here comes from engine computation, not user input,
+        # so skip the per-field validation pass
+        now = get_ist_now()
+        result_data = AutoTradingResult.from_trusted(
             session_id=session_id,
             # Configuration (stored with results since no separate session)
             symbols=config_data.get('symbols', engine.config.symbols),
@@ -223,8 +227,8 @@ async def run_historical_trading(session_id: str, engine: AutomatedTradingEngine
             position_size_percent=config_data.get('position_size_percent', engine.config.position_size_percent),
             timeframe=config_data.get('timeframe', engine.config.timeframe),
             # Timestamps
-            created_at=get_ist_now(),
-            completed_at=get_ist_now(),
+            created_at=now,
+            completed_at=now,
             # Capital breakdown
             current_capital=portfolio['current_capital'],
             invested_capital=portfolio['invested_capital'],
@@ -259,10 +263,10 @@ async def run_historical_trading(session_id: str, engine: AutomatedTradingEngine
         
         try:
             # Convert to dict for MongoDB
-            result_dict = result_data.dict()
+            result_dict = result_data.as_mapping()
             
             # Add timestamp for sorting in history
-            result_dict['timestamp'] = get_ist_now()
+            result_dict['timestamp'] = now
             
             print(f"[DB] Attempting to save result for session {session_id}")
             print(f"[DB] Result data keys: {list(result_dict.keys())}")
@@ -373,8 +377,11 @@ async def get_trading_results(session_id: str):
     
     engine = active_engines[session_id]
     results = engine.get_results()
-    
-    return results
+
+    # Results carry the full executed_trades and equity_curve payload;
+    # returning the response object directly skips FastAPI's
+    # jsonable_encoder pass and serializes straight through orjson
+    return ORJSONResponse(results)
 
 
 @router.post("/stop/{session_id}")
@@ -615,11 +622,13 @@ async def get_trading_history(limit: int = 50, skip: int = 0):
                 continue
         
         print(f"[DB] Returning {len(history)} history items")
-        
-        return {
+
+        # Large list payload: serialize straight through orjson (it
+        # handles the datetime values from Mongo natively)
+        return ORJSONResponse({
             "total": len(history),
             "history": history
-        }
+        })
         
     except Exception as e:
         import traceback
@@ -662,7 +671,7 @@ async def get_session_details(session_id: str):
                 trade['exit_timestamp'] = trade['exit_timestamp'].isoformat()
         
         # Build session info from result data
-        return {
+        return ORJSONResponse({
             "session": {
                 "session_id": result['session_id'],
                 "symbols": result.get('symbols', []),
@@ -680,7 +689,7 @@ async def get_session_details(session_id: str):
             "results": result,
             "trades": trades,
             "total_trades": len(trades)
-        }
+        })
         
     except HTTPException:
         raise
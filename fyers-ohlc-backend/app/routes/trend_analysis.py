@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
+import math
 import pandas as pd
 import pytz
 
@@ -79,17 +80,20 @@ async def get_stochastic_oscillator(
         # Calculate Stochastic Oscillator
         k, d = analyzer.calculate_stochastic_oscillator(df, k_period, d_period)
         
-        # Prepare response
+        # Prepare response; math.isnan on extracted floats instead of
+        # per-scalar pd.isna dispatch inside the row loop
         result = []
         for i in range(len(df)):
             if i >= k_period - 1:  # Only include periods where we have enough data
+                kv = float(k.iloc[i])
+                dv = float(d.iloc[i])
                 result.append({
                     'timestamp': df['datetime'].iloc[i].isoformat(),
                     'close': float(df['close'].iloc[i]),
-                    'k': float(k.iloc[i]) if not pd.isna(k.iloc[i]) else None,
-                    'd': float(d.iloc[i]) if not pd.isna(d.iloc[i]) else None,
-                    'is_overbought': k.iloc[i] > 80 if not pd.isna(k.iloc[i]) else False,
-                    'is_oversold': k.iloc[i] < 20 if not pd.isna(k.iloc[i]) else False
+                    'k': kv if not math.isnan(kv) else None,
+                    'd': dv if not math.isnan(dv) else None,
+                    'is_overbought': kv > 80,
+                    'is_oversold': kv < 20
                 })
         
         return {
@@ -81,35 +81,37 @@ def supertrend(df: pd.DataFrame, period: int = 10, multiplier: float = 3.0) -> p
     upperband = hl2 + (multiplier * atr_series)
     lowerband = hl2 - (multiplier * atr_series)
 
-    final_upper = upperband.copy()
-    final_lower = lowerband.copy()
-    supertrend = pd.Series(index=df.index, dtype='float64')
-    in_uptrend = True
-
-    for i in range(len(df)):
-        if i == 0:
-            final_upper.iat[i] = upperband.iat[i]
-            final_lower.iat[i] = lowerband.iat[i]
-            supertrend.iat[i] = final_lower.iat[i]
-            continue
-
-        if upperband.iat[i] < final_upper.iat[i - 1] or df["close"].iat[i - 1] > final_upper.iat[i - 1]:
-            final_upper.iat[i] = upperband.iat[i]
+    # Run the band recurrence on raw numpy buffers; every .iat access on
+    # a Series pays pandas indexing machinery per element
+    ub = upperband.to_numpy(dtype=np.float64)
+    lb = lowerband.to_numpy(dtype=np.float64)
+    cl = df["close"].to_numpy(dtype=np.float64)
+    n = len(df)
+
+    final_upper = ub.copy()
+    final_lower = lb.copy()
+    st = np.empty(n, dtype=np.float64)
+    if n:
+        st[0] = final_lower[0]
+
+    for i in range(1, n):
+        if ub[i] < final_upper[i - 1] or cl[i - 1] > final_upper[i - 1]:
+            final_upper[i] = ub[i]
         else:
-            final_upper.iat[i] = final_upper.iat[i - 1]
+            final_upper[i] = final_upper[i - 1]
 
-        if lowerband.iat[i] > final_lower.iat[i - 1] or df["close"].iat[i - 1] < final_lower.iat[i - 1]:
-            final_lower.iat[i] = lowerband.iat[i]
+        if lb[i] > final_lower[i - 1] or cl[i - 1] < final_lower[i - 1]:
+            final_lower[i] = lb[i]
         else:
-            final_lower.iat[i] = final_lower.iat[i - 1]
-
-        if supertrend.iat[i - 1] == final_upper.iat[i - 1] and df["close"].iat[i] <= final_upper.iat[i]:
-            supertrend.iat[i] = final_upper.iat[i]
-        elif supertrend.iat[i - 1] == final_upper.iat[i - 1] and df["close"].iat[i] > final_upper.iat[i]:
-            supertrend.iat[i] = final_lower.iat[i]
-        elif supertrend.iat[i - 1] == final_lower.iat[i - 1] and df["close"].iat[i] >= final_lower.iat[i]:
-            supertrend.iat[i] = final_lower.iat[i]
+            final_lower[i] = final_lower[i - 1]
+
+        if st[i - 1] == final_upper[i - 1] and cl[i] <= final_upper[i]:
+            st[i] = final_upper[i]
+        elif st[i - 1] == final_upper[i - 1] and cl[i] > final_upper[i]:
+            st[i] = final_lower[i]
+        elif st[i - 1] == final_lower[i - 1] and cl[i] >= final_lower[i]:
+            st[i] = final_lower[i]
         else:
-            supertrend.iat[i] = final_upper.iat[i]
+            st[i] = final_upper[i]
 
-    return supertrend
+    return pd.Series(st, index=df.index)